@@ -1,85 +1,82 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from concurrent.futures import ProcessPoolExecutor, wait
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from json import loads
+from os import cpu_count, environ
+from pydantic import BaseModel
 from traceback import format_exc
+from typing import Any, Callable
 
-import bitburner
-
-
-# Helper functions because lambda functions cannot be pickled
-def _total_ways_sum_II(data):
-    return bitburner.total_ways_sum(*data)
-
-def _array_jump_game(data):
-    return int(bitburner.array_jump_num(data) != -1)
-
-def _array_jump_game_II(data):
-    return max(0, bitburner.array_jump_num(data))
-
-def _generate_ips(data):
-    return str(bitburner.generate_ips(data)).replace("'", "")
-
-def _algorithm_stock_I(data):
-    return bitburner.algorithmic_stock(data, 1)
-
-def _algorithm_stock_II(data):
-    return bitburner.algorithmic_stock(data, len(data)//2)
-
-def _algorithm_stock_III(data):
-    return bitburner.algorithmic_stock(data, 2)
-
-def _algorithm_stock_IV(data):
-    return bitburner.algorithmic_stock(data[1], data[0])
-
-def _unique_paths_grid_I(data):
-    return bitburner.unique_paths_grid_I(*data)
-
-def _find_val_exp(data):
-    return bitburner.find_val_exp(*data)
-
-def _two_color(data):
-    return bitburner.two_color(*data)
-
-def _encrypt_caesar(data):
-    return bitburner.encrypt_caesar(*data)
-
-def _encrypt_vigenere(data):
-    return bitburner.encrypt_vigenere(*data)
-
-contract_funs = {
-    "Find Largest Prime Factor": bitburner.find_largest_prime_factor,
-    "Subarray with Maximum Sum": bitburner.subarray_max_sum,
-    "Total Ways to Sum": bitburner.total_ways_sum,
-    "Total Ways to Sum II": _total_ways_sum_II,
-    "Spiralize Matrix": bitburner.spiralize_matrix,
-    "Array Jumping Game": _array_jump_game,
-    "Array Jumping Game II": _array_jump_game_II,
-    "Merge Overlapping Intervals": bitburner.merge_overlapping_intervals,
-    "Generate IP Addresses": _generate_ips,
-    "Algorithmic Stock Trader I": _algorithm_stock_I,
-    "Algorithmic Stock Trader II": _algorithm_stock_II,
-    "Algorithmic Stock Trader III": _algorithm_stock_III,
-    "Algorithmic Stock Trader IV": _algorithm_stock_IV,
-    "Minimum Path Sum in a Triangle": bitburner.min_path_sum_triangle,
-    "Unique Paths in a Grid I": _unique_paths_grid_I,
-    "Unique Paths in a Grid II": bitburner.unique_paths_grid_II,
-    "Shortest Path in a Grid": bitburner.shortest_path_grid,
-    "Sanitize Parentheses in Expression": bitburner.sanitize_parentheses,
-    "Find All Valid Math Expressions": _find_val_exp,
-    "HammingCodes: Integer to Encoded Binary": bitburner.hamming_i2b,
-    "HammingCodes: Encoded Binary to Integer": bitburner.hamming_b2i,
-    "Proper 2-Coloring of a Graph": _two_color,
-    "Compression I: RLE Compression": bitburner.rle_compression,
-    "Compression II: LZ Decompression": bitburner.lz_decompression,
-    "Compression III: LZ Compression": bitburner.lz_compression,
-    "Encryption I: Caesar Cipher": _encrypt_caesar,
-    "Encryption II: Vigenère Cipher": _encrypt_vigenere
+import asyncio
+import logging
+
+from cache import ResultCache, contract_key
+from workers import kill_workers
+import registry
+
+
+# Maximum number of contracts solved at the same time
+MAX_CONCURRENT = int(environ.get("CONTRACTS_MAX_CONCURRENT", cpu_count() or 1))
+# Maximum number of contracts waiting for a free solver before requests are
+# rejected with 503
+MAX_QUEUED = int(environ.get("CONTRACTS_MAX_QUEUED", 100))
+# Default time budget in seconds for solving a single contract
+TIMEOUT = float(environ.get("CONTRACTS_TIMEOUT", 30))
+# Maximum number of cached answers
+CACHE_SIZE = int(environ.get("CONTRACTS_CACHE_SIZE", 1024))
+# Number of seconds after which cached answers expire
+CACHE_TTL = float(environ.get("CONTRACTS_CACHE_TTL", 7 * 24 * 60 * 60))
+# sqlite file to persist cached answers in, only kept in memory if unset
+CACHE_FILE = environ.get("CONTRACTS_CACHE_FILE")
+# "fast" to use the fast solvers, "verify" to also run the reference solvers
+# after answering, recording disagreements and reference timeouts
+SOLVER_MODE = environ.get("CONTRACTS_SOLVER_MODE", "fast")
+# Time budget in seconds for the reference solvers in verify mode
+REFERENCE_TIMEOUT = float(environ.get("CONTRACTS_REFERENCE_TIMEOUT", TIMEOUT))
+# Maximum number of reference solvers running at the same time in verify mode,
+# further checks are skipped
+REFERENCE_CONCURRENT = int(environ.get("CONTRACTS_REFERENCE_CONCURRENT", 1))
+
+
+# Time budgets in seconds for contract types that differ from TIMEOUT
+contract_timeouts = {
+    "Find All Valid Math Expressions": 4 * TIMEOUT,
+    "Sanitize Parentheses in Expression": 4 * TIMEOUT,
+    "Compression III: LZ Compression": 4 * TIMEOUT
 }
 
 
+class Contract(BaseModel):
+    c_type: str
+    data: Any
+
+
 app = FastAPI()
-pool = ProcessPoolExecutor()
+cache = ResultCache(CACHE_SIZE, CACHE_TTL, CACHE_FILE)
+# Most recent disagreements between fast and reference solvers and reference
+# solver failures in verify mode
+disagreements = deque(maxlen=100)
+# Running reference solver checks, referenced so they are not garbage
+# collected before they finish
+reference_checks = set()
+
+# Idle single process workers, contracts are queued while none is available.
+# Every worker solves one contract at a time, so it can be killed when its
+# contract exceeds the time budget without affecting other contracts.
+workers = asyncio.Queue()
+for _ in range(MAX_CONCURRENT):
+    workers.put_nowait(ProcessPoolExecutor(max_workers=1))
+# Number of contracts currently running or waiting for a solver
+pending = 0
+
+# Idle workers for the reference solvers in verify mode, separate from the
+# contract workers so slow reference solvers cannot delay contracts
+reference_workers = asyncio.Queue()
+if SOLVER_MODE == "verify":
+    for _ in range(REFERENCE_CONCURRENT):
+        reference_workers.put_nowait(ProcessPoolExecutor(max_workers=1))
 
 
 origins = [
@@ -91,18 +88,194 @@ origins = [
 app.add_middleware(CORSMiddleware, allow_origins=origins)
 
 
-@app.get("/solve_contract")
-def solve_contract(c_type: str, data: str):
-    data = loads(data)
+def _replace_worker(worker: ProcessPoolExecutor) -> ProcessPoolExecutor:
+    """
+    Kill a worker's process, aborting the contract it is currently solving,
+    and create a new worker.
+
+    :param worker: The worker to kill
+
+    :return: The new worker
+    """
+
+    kill_workers(worker)
+    return ProcessPoolExecutor(max_workers=1)
+
+
+async def _run(pool: asyncio.Queue, worker: ProcessPoolExecutor, timeout: float, func: Callable, *args) -> Any:
+    """
+    Run a function in an idle worker taken from a pool and put the worker
+    back afterwards. The worker is replaced if it exceeds the time budget or
+    its process dies.
+
+    :param pool: The pool the worker was taken from
+    :param worker: The worker
+    :param timeout: The time budget in seconds
+    :param func: The function to run, must be picklable
+    :param args: The function's arguments, must be picklable
+
+    :return: The function's result
+
+    :raises asyncio.TimeoutError: If the function exceeded the time budget
+    :raises BrokenProcessPool: If the worker's process died while running
+    the function
+    """
+
+    try:
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(worker, func, *args)
+        except BrokenProcessPool:
+            # The worker's process died while it was idle
+            worker = _replace_worker(worker)
+            future = loop.run_in_executor(worker, func, *args)
+        return await asyncio.wait_for(future, timeout)
+    except (asyncio.TimeoutError, BrokenProcessPool):
+        # The worker is either still busy with the function or its process
+        # died, e.g. by a crash or the OOM killer, so it would fail every
+        # later contract
+        worker = _replace_worker(worker)
+        raise
+    finally:
+        pool.put_nowait(worker)
+
+
+def _admit(count: int = 1) -> None:
+    """
+    Admit a request's contracts, counting them as pending. The caller has to
+    subtract them from pending once they are done.
+
+    :param count: The number of contracts in the request
+
+    :raises HTTPException: 413 if the request can never fit into the queue,
+    503 if too many contracts are queued right now
+    """
+
+    global pending
+
+    if count > MAX_CONCURRENT + MAX_QUEUED:
+        raise HTTPException(status_code=413,
+                            detail=f"Too many contracts, at most {MAX_CONCURRENT + MAX_QUEUED} are accepted at once")
+    if pending + count > MAX_CONCURRENT + MAX_QUEUED:
+        raise HTTPException(status_code=503, detail="Too many contracts queued, try again later")
+
+    pending += count
 
-    if c_type not in contract_funs.keys():
+
+async def _solve(c_type: str, data: Any, admitted: bool = False) -> Any:
+    """
+    Solve a contract in the process pool without blocking the event loop.
+
+    :param c_type: The coding contract type
+    :param data: The contract's data
+    :param admitted: If the contract belongs to a batch that was already
+    admitted and counted as pending as a whole
+
+    :return: The contract's answer
+    """
+
+    global pending
+
+    if c_type not in registry.solvers.keys():
         raise HTTPException(status_code=400, detail=f"Unknown coding contract `{c_type}`")
 
+    key = contract_key(c_type, data, registry.version)
+    cached, answer = cache.get(key)
+    if cached:
+        return answer
+
+    if not admitted:
+        _admit()
+
+    timeout = contract_timeouts.get(c_type, TIMEOUT)
+
     try:
         # Run in own process to prevent blocking main process
-        return pool.submit(contract_funs[c_type], data).result()
+        answer = await _run(workers, await workers.get(), timeout, registry.solve, c_type, data)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"Solving `{c_type}` exceeded the time budget of {timeout}s")
+    except BrokenProcessPool:
+        raise HTTPException(status_code=500, detail=f"Solver process died while solving `{c_type}`")
     except Exception:
         raise HTTPException(status_code=500, detail=format_exc())
+    finally:
+        if not admitted:
+            pending -= 1
+
+    if SOLVER_MODE == "verify":
+        # Skip the check if all reference workers are busy, so checks cannot
+        # pile up
+        try:
+            worker = reference_workers.get_nowait()
+        except asyncio.QueueEmpty:
+            logging.info(f"All reference solvers busy, skipping check of `{c_type}`")
+        else:
+            check = asyncio.create_task(_check_reference(worker, c_type, data, answer))
+            reference_checks.add(check)
+            check.add_done_callback(reference_checks.discard)
+
+    cache.put(key, answer)
+    return answer
+
+
+async def _check_reference(worker: ProcessPoolExecutor, c_type: str, data: Any, answer: Any) -> None:
+    """
+    Solve a contract with the reference solver within its own time budget
+    and record if it disagrees with the fast solver's answer or fails.
+
+    :param worker: The idle reference worker to run the reference solver in
+    :param c_type: The coding contract type
+    :param data: The contract's data
+    :param answer: The fast solver's answer
+    """
+
+    error = None
+    reference = None
+    try:
+        reference, agree = await _run(reference_workers, worker, REFERENCE_TIMEOUT,
+                                      registry.verify, c_type, data, answer)
+        if agree:
+            return
+        logging.warning(f"Fast and reference solver disagree on `{c_type}`")
+    except asyncio.TimeoutError:
+        error = f"Reference solver exceeded the time budget of {REFERENCE_TIMEOUT}s"
+    except BrokenProcessPool:
+        error = "Reference solver process died"
+    except Exception:
+        error = format_exc()
+
+    if error is not None:
+        logging.warning(f"Reference solver failed on `{c_type}`: {error}")
+    disagreements.append({"c_type": c_type, "data": data, "fast": answer, "reference": reference, "error": error})
+
+
+@app.get("/solve_contract")
+async def solve_contract(c_type: str, data: str):
+    return await _solve(c_type, loads(data))
+
+@app.post("/solve_contracts")
+async def solve_contracts(contracts: list[Contract]):
+    global pending
+
+    # A batch is admitted or rejected as a whole, so it cannot reject its own
+    # tail
+    _admit(len(contracts))
+    try:
+        results = await asyncio.gather(*(_solve(c.c_type, c.data, admitted=True) for c in contracts),
+                                       return_exceptions=True)
+    finally:
+        pending -= len(contracts)
+
+    return [{"error_code": r.status_code, "error": r.detail} if isinstance(r, HTTPException) else {"answer": r}
+            for r in results]
+
+@app.get("/cache_stats")
+def cache_stats():
+    return cache.stats()
+
+@app.get("/disagreements")
+def get_disagreements():
+    return list(disagreements)
 
 @app.get("/ping")
 def ping():
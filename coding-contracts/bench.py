@@ -0,0 +1,365 @@
+from argparse import ArgumentParser
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from copy import deepcopy
+from functools import partial
+from os import cpu_count
+from statistics import median
+from time import perf_counter
+import json
+import random
+import string
+import sys
+
+from workers import kill_workers
+import bitburner
+import registry
+
+
+def _random_text(rng: random.Random, length: int, alphabet: str = string.ascii_letters) -> str:
+    """
+    Generate text with repetitions, like the plain texts of compression
+    contracts.
+
+    :param rng: The random number generator
+    :param length: The text's length
+    :param alphabet: The characters to use
+
+    :return: The generated text
+    """
+
+    text = ""
+    while len(text) < length:
+        # Either repeat a recent part of the text or add new characters
+        if text and rng.random() < 0.5:
+            start = rng.randrange(max(0, len(text) - 9), len(text))
+            text += text[start:start + rng.randint(1, 9)]
+        else:
+            text += "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+
+    return text[:length]
+
+
+def _random_grid(rng: random.Random, size: int, obstacles: float) -> list[list[int]]:
+    """
+    Generate a square grid with free corners.
+
+    :param rng: The random number generator
+    :param size: The grid's width and height
+    :param obstacles: The probability of a field being an obstacle
+
+    :return: The grid with obstacles denoted by 1 and empty fields by 0
+    """
+
+    grid = [[int(rng.random() < obstacles) for _ in range(size)] for _ in range(size)]
+    grid[0][0] = grid[-1][-1] = 0
+
+    return grid
+
+
+def _random_prices(rng: random.Random, size: int) -> list[int]:
+    """
+    Generate stock prices.
+
+    :param rng: The random number generator
+    :param size: The number of prices
+
+    :return: The prices
+    """
+
+    return [rng.randint(1, 200) for _ in range(size)]
+
+
+def _flip_bit(rng: random.Random, code: str) -> str:
+    """
+    Flip a random bit of a binary string.
+
+    :param rng: The random number generator
+    :param code: The binary string
+
+    :return: The binary string with one flipped bit
+    """
+
+    i = rng.randrange(len(code))
+    return code[:i] + "10"[int(code[i])] + code[i + 1:]
+
+
+# Input generators for every contract type and the input sizes to generate.
+# The meaning of a size depends on the contract type.
+generators = {
+    "Find Largest Prime Factor": (lambda rng, n: rng.randrange(2, 2 ** n), (16, 32, 48, 64)),
+    "Subarray with Maximum Sum": (lambda rng, n: [rng.randint(-10, 10) for _ in range(n)], (10, 100, 1000, 10000)),
+    "Total Ways to Sum": (lambda rng, n: n, (10, 100, 1000)),
+    "Total Ways to Sum II": (lambda rng, n: [n, sorted(rng.sample(range(1, n), min(n - 1, 12)))], (10, 100, 1000)),
+    "Spiralize Matrix": (lambda rng, n: [[rng.randint(0, 50) for _ in range(n)] for _ in range(n)], (4, 16, 64, 256)),
+    "Array Jumping Game": (lambda rng, n: [rng.randint(0, 5) for _ in range(n)], (10, 100, 1000, 10000)),
+    "Array Jumping Game II": (lambda rng, n: [rng.randint(1, 5) for _ in range(n)], (10, 100, 1000, 10000)),
+    "Merge Overlapping Intervals": (lambda rng, n: [[a, a + rng.randint(1, 10)] for a in (rng.randrange(5 * n) for _ in range(n))],
+                                    (10, 100, 1000, 10000)),
+    "Generate IP Addresses": (lambda rng, n: "".join(rng.choice("0123456789") for _ in range(n)), (4, 6, 8, 10, 12)),
+    "Algorithmic Stock Trader I": (_random_prices, (10, 100, 1000, 10000)),
+    "Algorithmic Stock Trader II": (_random_prices, (10, 100, 1000, 10000)),
+    "Algorithmic Stock Trader III": (_random_prices, (10, 100, 1000, 10000)),
+    "Algorithmic Stock Trader IV": (lambda rng, n: [max(1, n // 5), _random_prices(rng, n)], (10, 100, 1000)),
+    "Minimum Path Sum in a Triangle": (lambda rng, n: [[rng.randint(1, 9) for _ in range(r + 1)] for r in range(n)],
+                                       (5, 10, 100, 1000)),
+    "Unique Paths in a Grid I": (lambda rng, n: [n, n], (4, 16, 64, 256)),
+    "Unique Paths in a Grid II": (lambda rng, n: _random_grid(rng, n, 0.15), (4, 16, 64, 256)),
+    "Shortest Path in a Grid": (lambda rng, n: _random_grid(rng, n, 0.2), (4, 8, 12, 20, 30, 50, 100)),
+    "Sanitize Parentheses in Expression": (lambda rng, n: "".join(rng.choice("((()))a") for _ in range(n)), (8, 16, 24, 32)),
+    "Find All Valid Math Expressions": (lambda rng, n: ["".join(rng.choice("0123456789") for _ in range(n)), rng.randint(-100, 100)],
+                                        (4, 6, 8, 10, 12)),
+    "HammingCodes: Integer to Encoded Binary": (lambda rng, n: rng.getrandbits(n), (8, 64, 512, 4096)),
+    "HammingCodes: Encoded Binary to Integer": (lambda rng, n: _flip_bit(rng, bitburner.hamming_i2b(rng.getrandbits(n))),
+                                                (8, 64, 512, 4096)),
+    "Proper 2-Coloring of a Graph": (lambda rng, n: [n, [[rng.randrange(n), rng.randrange(n)] for _ in range(n)]],
+                                     (10, 100, 1000, 10000)),
+    "Compression I: RLE Compression": (lambda rng, n: "".join(rng.choice("aAbB") * rng.randint(1, 12) for _ in range(n // 6))[:n],
+                                       (100, 1000, 10000, 100000, 1000000, 4000000)),
+    "Compression II: LZ Decompression": (lambda rng, n: bitburner.lz_compression(_random_text(rng, n, "abcde")),
+                                         (10, 100, 1000, 10000)),
+    "Compression III: LZ Compression": (lambda rng, n: _random_text(rng, n, "abcde"), (10, 20, 100, 1000)),
+    "Encryption I: Caesar Cipher": (lambda rng, n: [_random_text(rng, n, string.ascii_uppercase + " "), rng.randint(1, 25)],
+                                    (100, 1000, 10000, 100000, 1000000, 4000000)),
+    "Encryption II: Vigenère Cipher": (lambda rng, n: [_random_text(rng, n, string.ascii_uppercase + " "),
+                                                       _random_text(rng, rng.randint(5, 12), string.ascii_uppercase)],
+                                       (100, 1000, 10000, 100000, 1000000, 4000000))
+}
+
+
+# Contract types whose size is a number of characters, so their throughput is
+# reported as well
+throughput = {
+    "Compression I: RLE Compression",
+    "Encryption I: Caesar Cipher",
+    "Encryption II: Vigenère Cipher"
+}
+
+# Budget multipliers for expensive contract types, like api.py's time budgets
+budget_factors = {
+    "Find All Valid Math Expressions": 4,
+    "Sanitize Parentheses in Expression": 4,
+    "Compression III: LZ Compression": 4
+}
+
+
+def _variant(c_type: str, fast: Callable) -> registry.Solver:
+    """
+    Create a solver for a contract type with another fast implementation.
+
+    :param c_type: The coding contract type
+    :param fast: The fast implementation
+
+    :return: The solver
+    """
+
+    solver = registry.solvers[c_type]
+    return registry.Solver(fast, solver.reference, solver.normalize, solver.answer, solver.equal)
+
+
+# Number of processes for solvers splitting their work
+PROCESSES = max(2, cpu_count() or 1)
+
+# Solvers with other parameters than the registered ones by name, benchmarked
+# on the inputs of their contract type
+variants = {
+    f"Find All Valid Math Expressions ({PROCESSES} processes)": (
+        "Find All Valid Math Expressions", _variant("Find All Valid Math Expressions",
+                                                    partial(bitburner.find_val_exp, processes=PROCESSES)))
+}
+
+
+def _measure(name: str, data, warmup: int, repeat: int, reference: bool) -> list[float]:
+    """
+    Time a contract type's solver or a variant on one input.
+
+    :param name: The coding contract type or variant
+    :param data: The contract's data
+    :param warmup: The number of untimed runs before timing
+    :param repeat: The number of timed runs
+    :param reference: If the reference solver should be timed instead of
+    the fast one
+
+    :return: The times of the timed runs in seconds
+    """
+
+    solver = variants[name][1] if name in variants else registry.solvers[name]
+
+    times = []
+    for i in range(warmup + repeat):
+        # Some reference solvers modify their input
+        d = deepcopy(data)
+        start = perf_counter()
+        solver.solve(d, reference)
+        if i >= warmup:
+            times.append(perf_counter() - start)
+
+    return times
+
+
+def benchmark(name: str, seed: int = 0, warmup: int = 1, repeat: int = 5, budget: float = 1.0,
+              reference: bool = False, compare: bool = False) -> list[dict]:
+    """
+    Time a contract type's solver or a variant at increasing input sizes.
+    Larger sizes are skipped as soon as a size exceeds the budget. The solver
+    runs in its own process, so it can be killed if it does not finish in
+    time.
+
+    :param name: The coding contract type or variant
+    :param seed: The seed for generating inputs
+    :param warmup: The number of untimed runs before timing
+    :param repeat: The number of timed runs
+    :param budget: The maximum median time in seconds for a single run,
+    multiplied by the contract type's budget factor
+    :param reference: If the reference solver should be timed instead of
+    the fast one
+    :param compare: If the reference solver should be timed on the same
+    inputs as well
+
+    :return: The results for every size as dicts with the size, the minimum
+    and median time, which are None if the solver was killed or raised an
+    error, the error if it raised one, the throughput in MB/s if the
+    contract type is in throughput and if the budget was exceeded. If
+    compare is set, they also contain the same values for the reference
+    solver and if it was skipped, because it failed at a smaller size.
+    """
+
+    c_type = variants[name][0] if name in variants else name
+    generate, sizes = generators[c_type]
+    budget *= budget_factors.get(c_type, 1)
+    # Every run may take up to twice the budget before the solver is killed
+    timeout = 2 * budget * (warmup + repeat)
+
+    results = []
+    worker = ProcessPoolExecutor(max_workers=1)
+    try:
+        for size in sizes:
+            data = generate(random.Random(f"{seed}-{c_type}-{size}"), size)
+
+            row = {"size": size}
+            runs = [("", reference)]
+            if compare:
+                runs.append(("reference_", True))
+            for prefix, ref in runs:
+                times = None
+                # A reference solver that failed would fail at larger sizes too
+                if prefix and results and results[-1]["reference_median"] is None:
+                    row[prefix + "skipped"] = True
+                else:
+                    try:
+                        times = worker.submit(_measure, name, data, warmup, repeat, ref).result(timeout)
+                    except TimeoutError:
+                        kill_workers(worker, wait=True)
+                        worker = ProcessPoolExecutor(max_workers=1)
+                    except Exception as e:
+                        row[prefix + "error"] = f"{type(e).__name__}: {e}"
+                row[prefix + "min"] = times and min(times)
+                row[prefix + "median"] = times and median(times)
+
+            if c_type in throughput:
+                row["mb_per_s"] = row["median"] and size / row["median"] / 1e6
+            row["slow"] = row["median"] is None or row["median"] > budget
+            results.append(row)
+            if row["slow"]:
+                break
+    finally:
+        worker.shutdown(cancel_futures=True)
+
+    return results
+
+
+def _format_time(row: dict, prefix: str = "") -> str:
+    """
+    Format a measured time for the table.
+
+    :param row: The result for one size
+    :param prefix: The prefix of the time's keys in the result
+
+    :return: The formatted time
+    """
+
+    if row.get(prefix + "error"):
+        return "    failed"
+    if row.get(prefix + "skipped"):
+        return "   skipped"
+    if row[prefix + "median"] is None:
+        return "    killed"
+    return f"{row[prefix + 'median'] * 1000:>9.3f}ms"
+
+
+def format_table(results: dict[str, list[dict]]) -> str:
+    """
+    Format benchmark results as a text table of median times against sizes.
+    Reference times are added with the fast solver's speedup if they were
+    measured.
+
+    :param results: The results by contract type
+
+    :return: The table
+    """
+
+    width = max(map(len, results), default=0)
+    lines = []
+    for c_type, rows in results.items():
+        cells = []
+        for r in rows:
+            cell = f"{r['size']:>7}: {_format_time(r)}"
+            if r.get("mb_per_s"):
+                cell += f" {r['mb_per_s']:>7.1f}MB/s"
+            if "reference_median" in r:
+                cell += f" (ref {_format_time(r, 'reference_').strip()}"
+                if r["median"] and r["reference_median"]:
+                    cell += f", {r['reference_median'] / r['median']:.1f}x"
+                cell += ")"
+            cells.append(cell + (" SLOW" if r["slow"] else ""))
+        lines.append(f"{c_type:<{width}}  " + "  ".join(cells))
+
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Benchmark the coding contract solvers at increasing input sizes.")
+    parser.add_argument("c_types", nargs="*", help="Contract types or variants to benchmark, default is all")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generating inputs")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs before timing")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per size")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="Maximum median seconds per run, expensive contract types get more")
+    solvers = parser.add_mutually_exclusive_group()
+    solvers.add_argument("--reference", action="store_true", help="Time the reference solvers instead of the fast ones")
+    solvers.add_argument("--compare", action="store_true", help="Time the reference solvers as well and show the speedup")
+    parser.add_argument("--json", help="File to write the results to as JSON")
+    parser.add_argument("--table", help="File to write the table to instead of stdout")
+    args = parser.parse_args()
+
+    c_types = args.c_types or list(registry.solvers) + list(variants)
+    if unknown := [c for c in c_types if c not in generators and c not in variants]:
+        parser.error(f"Unknown coding contracts {unknown}")
+
+    results = {c: benchmark(c, args.seed, args.warmup, args.repeat, args.budget, args.reference, args.compare) for c in c_types}
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    table = format_table(results)
+    if args.table:
+        with open(args.table, "w") as f:
+            f.write(table + "\n")
+    else:
+        print(table)
+
+    slow = [c for c, rows in results.items() if any(r["slow"] for r in rows)]
+    if slow:
+        print(f"Solvers exceeding their budget or failing: {', '.join(slow)}", file=sys.stderr)
+    for c, rows in results.items():
+        for r in rows:
+            for prefix in ("", "reference_"):
+                if r.get(prefix + "error"):
+                    print(f"{c} {'reference ' if prefix else ''}solver failed at size {r['size']}: {r[prefix + 'error']}", file=sys.stderr)
+
+    return int(bool(slow))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,28 @@
 from __future__ import annotations as _annotations
-from collections.abc import Iterable as _Iterable
+from array import array as _array
+from collections.abc import Iterable as _Iterable, Iterator as _Iterator
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+import bisect as _bisect
+import functools as _functools
 import itertools as _itertools
+import math as _math
 import re as _re
+import string as _string
 
 from clib import largest_prime_factor as _c_prime_fac
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+
+# Translation tables shifting letters right by their index, keeping case
+_SHIFT_TABLES = [str.maketrans(_string.ascii_uppercase + _string.ascii_lowercase,
+                               _string.ascii_uppercase[i:] + _string.ascii_uppercase[:i]
+                               + _string.ascii_lowercase[i:] + _string.ascii_lowercase[:i])
+                 for i in range(26)]
+
 
 def hamming_i2b(num: int) -> str:
     """
@@ -16,27 +34,24 @@ def hamming_i2b(num: int) -> str:
     :return: The hamming encoded number in binary format as a string
     """
 
-    num = [int(b, 2) for b in bin(num)[2:]]
-
-    num.insert(0, 0)
-    p = 1
-    while p < len(num):
-        num.insert(p, 0)
-        p *= 2
-    p //= 2
+    data = bin(num)[2:]
+    length, positions = _hamming_layout(len(data))
 
-    while p > 0:
-        s = 0
+    # The code as integer, bit i is the code's i-th character
+    code = 0
+    for pos, bit in zip(positions, data):
+        if bit == "1":
+            code |= 1 << pos
 
-        for i in range(p, len(num), p * 2):
-            s += sum(num[i:i + p])
+    # Setting parity bit 2^k to bit k of the syndrome of the data bits makes
+    # the syndrome of the whole code zero
+    syndrome = _hamming_syndrome(code)
+    for k in range(syndrome.bit_length()):
+        if syndrome >> k & 1:
+            code |= 1 << (1 << k)
+    code |= bin(code).count("1") & 1
 
-        num[p] = s % 2
-        p //= 2
-
-    num[0] = sum(num) % 2
-
-    return "".join(map(str, num))
+    return format(code, f"0{length}b")[::-1]
 
 
 def hamming_b2i(code: str) -> int:
@@ -49,34 +64,98 @@ def hamming_b2i(code: str) -> int:
     :return: The number encoded in code
     """
 
-    code = [int(c, 2) for c in code]
+    # The code as integer, bit i is the code's i-th character
+    bits = int(code[::-1], 2)
 
-    # Calculate error bits
-    error = 0
-    p = 1
-    while p < len(code):
-        s = 0
-
-        for i in range(p, len(code), p * 2):
-            s += sum(code[i:i + p])
-
-        error |= (s % 2)*p
-        p *= 2
+    # The syndrome is the position of a single flipped bit
+    error = _hamming_syndrome(bits)
 
     # Error exists but overall parity is even -> two bit error
-    if error != 0 and (sum(code) % 2) == 0:
+    if error != 0 and (bin(bits).count("1") & 1) == 0:
         raise RuntimeError("Two bit error detected")
 
-    code[error] = (code[error] + 1) % 2
+    bits ^= 1 << error
+
+    return int("".join("1" if bits >> pos & 1 else "0" for pos in _hamming_data_positions(len(code))), 2)
+
+
+def hamming_i2b_many(nums: _Iterable[int]) -> list[str]:
+    """
+    Calculate the extended hamming codes for many numbers.
+
+    :param nums: The numbers to calculate the hamming codes for
+
+    :return: The hamming encoded numbers in binary format as strings
+    """
 
-    # Remove error bits from code
-    p //= 2
-    while p > 0:
-        code.pop(p)
-        p //= 2
-    code.pop(0)
+    return [hamming_i2b(n) for n in nums]
 
-    return int("".join(map(str, code)), 2)
+
+def hamming_b2i_many(codes: _Iterable[str]) -> list[int]:
+    """
+    Calculate the integer values for many hamming encoded strings while
+    correcting 1-bit-errors.
+
+    :param codes: The hamming codes
+
+    :return: The numbers encoded in codes
+    """
+
+    return [hamming_b2i(c) for c in codes]
+
+
+def _hamming_syndrome(code: int) -> int:
+    """
+    Calculate the syndrome of a hamming code, which is the XOR of the
+    positions of all set bits.
+
+    :param code: The hamming code as integer, bit i being the i-th position
+
+    :return: The syndrome
+    """
+
+    syndrome = 0
+    while code:
+        low = code & -code
+        syndrome ^= low.bit_length() - 1
+        code ^= low
+
+    return syndrome
+
+
+@_functools.cache
+def _hamming_data_positions(length: int) -> tuple[int]:
+    """
+    Return the positions of the data bits in a hamming code, which are all
+    positions except 0 and the powers of two.
+
+    :param length: The length of the hamming code
+
+    :return: The data bit positions in ascending order
+    """
+
+    return tuple(i for i in range(3, length) if i & (i - 1))
+
+
+@_functools.cache
+def _hamming_layout(data_len: int) -> tuple[int, tuple[int]]:
+    """
+    Return the length of the hamming code for a number of data bits and the
+    positions of the data bits.
+
+    :param data_len: The number of data bits
+
+    :return: The hamming code's length and its data bit positions
+    """
+
+    # Overall parity bit and one parity bit for every power of two in the code
+    length = data_len + 1
+    p = 1
+    while p < length:
+        length += 1
+        p *= 2
+
+    return length, _hamming_data_positions(length)
 
 
 def rle_compression(plain: str) -> str:
@@ -88,18 +167,18 @@ def rle_compression(plain: str) -> str:
     :return: The compressed string
     """
 
-    compressed = ""
+    compressed = []
 
-    while plain:
-        l = len(plain)
-        c = plain[0]
-        plain = plain.lstrip(c)
+    # Every match is a maximal run of one character
+    for run in _re.finditer(r"(.)\1*", plain, _re.DOTALL):
+        c = run[1]
+        l = run.end() - run.start()
 
-        compressed += f"9{c}"*((l - len(plain)) // 9)
-        if r := ((l - len(plain)) % 9):
-            compressed += f"{(l - len(plain)) % 9}{c}"
+        compressed.append(f"9{c}" * (l // 9))
+        if l % 9:
+            compressed.append(f"{l % 9}{c}")
 
-    return compressed
+    return "".join(compressed)
 
 
 def algorithmic_stock(prices: tuple[int], num_transactions: int) -> int:
@@ -108,131 +187,223 @@ def algorithmic_stock(prices: tuple[int], num_transactions: int) -> int:
 
     :param prices: The list of prices
     :param num_transactions: The maximum number of transactions allowed
-    :param part_sum: The base gain from already chosen transactions, used for recursion
 
     :return: The maximum amount of money earnable under the given circumstances
     """
 
-    def _get_transactions(prices: tuple[int]) -> _Iterable[tuple[tuple[int,int],int]]:
-        """
-        Get all transactions possible for the given prices.
+    if num_transactions <= 0 or len(prices) < 2:
+        return 0
 
-        :param prices: The list of prices
+    # With at least one transaction for every two days, every price increase
+    # can be used
+    if num_transactions >= len(prices) // 2:
+        return sum(max(0, b - a) for a, b in zip(prices, prices[1:]))
 
-        :return: An iterator over all transactions possible
-        """
+    # Maximum balance after the t-th buy and after the t-th sell so far
+    buys = [-prices[0]] * num_transactions
+    sells = [0] * num_transactions
 
-        return filter(lambda x: x[1] > 0, map(lambda x: (x, prices[x[1]] - prices[x[0]]), _itertools.combinations(range(len(prices)), r=2)))
+    for p in prices[1:]:
+        prev_sell = 0
+        for t in range(num_transactions):
+            sells[t] = max(sells[t], buys[t] + p)
+            buys[t] = max(buys[t], prev_sell - p)
+            prev_sell = sells[t]
 
-    def _remove_overlapping(transactions: tuple[tuple[tuple[int,int],int]], element: tuple[tuple[int,int],int]) -> _Iterable[tuple[tuple[int,int],int]]:
-        """
-        Remove all elements from transactions that overlap with element.
+    return max(sells)
 
-        :param transactions: The transactions to filter
-        :param element: The element overlapping
 
-        :return: An iterator over all elements from transactions that do not overlap with element
-        """
+def array_jump_reach(array: tuple[int]) -> tuple[list[int], list[int]]:
+    """
+    Given an array of maximum jump lengths from the respective positions,
+    determine all positions reachable from the start and a path with the
+    minimum number of jumps to the end.
 
-        return filter(lambda x: not (element[0][0] <= x[0][0] <= element[0][1] or element[0][0] <= x[0][1] <= element[0][0]), transactions)
+    :param array: The array of jump lengths
 
-    def _get_max_transaction_gain(transactions: _Iterable[tuple[tuple[int,int],int]], num_transactions: int, part_sum: int = 0) -> int:
-        """
-        Get maximum gain from at most num_transactions transactions from transactions.
+    :return: The reachable positions in ascending order and the positions
+    visited on a shortest path to the end, which is empty if the end cannot
+    be reached
+    """
 
-        :param transactions: The possible transactions to choose from
-        :param num_transactions: The maximum number of transactions allowed
-        :param part_sum: The base gain from already chosen transactions, used for recursion
+    if not array:
+        return [], []
 
-        :return: The maximum amount of money earnable under the given circumstances
-        """
+    # Positions are reached in ascending order, so all positions before
+    # reached have been reached. parents maps every reached position to the
+    # first position jumping to it, which is in the earliest possible jump.
+    parents = [0] * len(array)
+    reached = 1
+    for i in range(len(array)):
+        if i >= reached:
+            break
+
+        end = min(len(array), i + array[i] + 1)
+        for j in range(reached, end):
+            parents[j] = i
+        reached = max(reached, end)
+
+    if reached < len(array):
+        return list(range(reached)), []
 
-        if num_transactions <= 0:
-            return part_sum
-        max_sum = part_sum
-        # transactions = tuple(transactions)
-        t1, t2 = _itertools.tee(transactions, 2)
-        # for i, t in enumerate(transactions)
-        for i, t in enumerate(t1):
-            t2, t3 = _itertools.tee(t2, 2)
-            # if (s := _get_max_transaction_gain(_remove_overlapping(transactions[i:], t), num_transactions - 1, part_sum + t[1])) > max_sum:
-            if (s := _get_max_transaction_gain(_remove_overlapping(_itertools.islice(t3, i, None), t), num_transactions - 1, part_sum + t[1])) > max_sum:
-                max_sum = s
-        return max_sum
+    path = [len(array) - 1]
+    while path[-1] != 0:
+        path.append(parents[path[-1]])
 
-    trs = tuple(filter(lambda x: x[1] > 0, _get_transactions(prices)))
-    return _get_max_transaction_gain(filter(lambda x: not any(map(lambda y: y != x and x[0][0] <= y[0][0] and y[0][1] <= x[0][1] and y[1] >= x[1], trs)), trs),
-                                     num_transactions)
+    return list(range(reached)), path[::-1]
 
 
-def array_jump_num(array: tuple[int], index: int = 0, jumps: int = 0) -> int:
+def array_jump_num(array: tuple[int]) -> int:
     """
     Given an array of maximum jump lengths from the respective positions,
     determine the minimum number of jumps to get to the end or -1 if it
     is impossible.
 
     :param array: The array of jump lengths
-    :param index: The current postion in the array, used for recursion
 
     :return: The minimum number of jumps to the end or -1
     """
 
-    if index >= len(array):
-        return -1
+    return len(array_jump_reach(array)[1]) - 1
 
-    if index == len(array) - 1:
-        return jumps
 
-    min_jumps = -1
-    for j in range(1, array[index] + 1):
-        if (jmp := array_jump_num(array, index + j, jumps + 1)) != -1 and (min_jumps == -1 or jmp < min_jumps):
-            min_jumps = jmp
-
-    return min_jumps
-
-
-def find_val_exp(digits: str, result: int, operators: tuple[str] = ("+", "-", "*")) -> list[str]:
+def find_val_exp(digits: str, result: int, operators: tuple[str] = ("+", "-", "*"), processes: int = 1) -> list[str]:
     """
     Find all possibilities to add mathematical operators to a string of
     digits to get a specific result. Numbers in the returned expressions
     will not have leading zeroes.
 
-    !Warning! This function uses eval on strings created from digits and
-    operators. Therefore it should be ran with arbitrary user input.
+    :param digits: The string of digits to add the operators to
+    :param result: The desired calculation result
+    :param operators: The operators to add, a subset of +, - and *
+    :param processes: The number of processes to split the search over
+
+    :return: All possible mathematical expressions equaling the result as strings
+    """
+
+    if not set(operators) <= {"+", "-", "*"}:
+        raise ValueError(f"Unsupported operators {set(operators) - {'+', '-', '*'}}")
+
+    # At least one operator is needed, so the first number cannot contain
+    # all digits
+    states = [(end, digits[:end], int(digits[:end]), int(digits[:end])) for end in _val_exp_num_ends(digits, 0)
+              if end < len(digits)] if digits else []
+
+    if processes <= 1:
+        return [expr for state in states for expr in _find_val_exp_from(digits, result, operators, *state)]
+
+    # Split the search after the first operator and the second number, as
+    # splitting after the first number only would give one process most of
+    # the work
+    states = [next_state for state in states for next_state in _val_exp_next_states(digits, operators, *state)]
+    with _ProcessPoolExecutor(processes) as pool:
+        parts = pool.map(_find_val_exp_from, *zip(*((digits, result, operators) + state for state in states)),
+                         chunksize=max(1, len(states) // (processes * 8)))
+        return [expr for part in parts for expr in part]
+
+
+def _val_exp_num_ends(digits: str, pos: int) -> range:
+    """
+    Return the possible ends of a number starting at pos in digits.
+
+    :param digits: The string of digits
+    :param pos: The start of the number
+
+    :return: The possible (exclusive) ends of the number
+    """
+
+    # Numbers starting with zero may only consist of that zero
+    return range(pos + 1, len(digits) + 1 if digits[pos] != "0" else pos + 2)
+
+
+def _val_exp_next_states(digits: str, operators: tuple[str], pos: int, expr: str,
+                         value: int, last: int) -> list[tuple[str,int,int,int]]:
+    """
+    Return all states reachable by appending an operator and a number to an
+    expression for find_val_exp.
+
+    :param digits: The string of digits to add the operators to
+    :param operators: The operators to add
+    :param pos: The position of the next digit to use
+    :param expr: The expression built so far
+    :param value: The value of expr
+    :param last: The value of the last product in expr, which is needed
+    to apply operator precedence when appending a multiplication
+
+    :return: The next states as (pos, expr, value, last) tuples
+    """
+
+    if pos == len(digits):
+        return [(pos, expr, value, last)]
+
+    states = []
+    for end in _val_exp_num_ends(digits, pos):
+        num_str = digits[pos:end]
+        num = int(num_str)
+
+        if "+" in operators:
+            states.append((end, f"{expr}+{num_str}", value + num, num))
+        if "-" in operators:
+            states.append((end, f"{expr}-{num_str}", value - num, -num))
+        if "*" in operators:
+            states.append((end, f"{expr}*{num_str}", value - last + last * num, last * num))
+
+    return states
+
+
+def _find_val_exp_from(digits: str, result: int, operators: tuple[str], pos: int, expr: str,
+                       value: int, last: int) -> list[str]:
+    """
+    Find all expressions for find_val_exp continuing a partial expression.
+    This is a module level function so it can be run in other processes.
 
     :param digits: The string of digits to add the operators to
     :param result: The desired calculation result
     :param operators: The operators to add
+    :param pos: The position of the next digit to use
+    :param expr: The expression built so far
+    :param value: The value of expr
+    :param last: The value of the last product in expr
 
-    :return: All possible mathematical expressions equaling the result as strings
+    :return: All complete expressions continuing expr equaling the result
     """
 
-    expressions = []
+    def _search(pos: int, value: int, last: int) -> None:
+        """
+        Recursively append operators and numbers to the expression in parts,
+        adding all complete expressions equaling the result to expressions.
 
-    # For all possible numbers of operators
-    for n in range(1, len(digits)):
-        # For all possible n-length combinations and permutations of operators
-        for ops in _itertools.product(operators, repeat=n):
-            # For all possible positions of the n operators
-            for inds in _itertools.combinations(range(1, len(digits)), r=n):
-
-                # Build expression
-                inds += (len(digits),)
-                expr = digits[:inds[0]]
-                for i in range(n):
-                    expr = f"{expr}{ops[i]}{digits[inds[i]:inds[i+1]]}"
-
-                # Prevent leading zeroes in expressions
-                if _re.search(r"(^|\D)0\d", expr):
-                    continue
+        :param pos: The position of the next digit to use
+        :param value: The value of the expression
+        :param last: The value of the last product in the expression
+        """
 
-                # Add expressions equaling result to expressions, ignore
-                # all invalid ones and wrong results
-                try:
-                    if eval(expr) == result:
-                        expressions.append(expr)
-                except:
-                    pass
+        if pos == len(digits):
+            if value == result:
+                expressions.append("".join(parts))
+            return
+
+        for end in _val_exp_num_ends(digits, pos):
+            num_str = digits[pos:end]
+            num = int(num_str)
+
+            parts.append("")
+            parts.append(num_str)
+            if plus:
+                parts[-2] = "+"
+                _search(end, value + num, num)
+            if minus:
+                parts[-2] = "-"
+                _search(end, value - num, -num)
+            if times:
+                parts[-2] = "*"
+                _search(end, value - last + last * num, last * num)
+            del parts[-2:]
+
+    plus, minus, times = "+" in operators, "-" in operators, "*" in operators
+    expressions = []
+    parts = [expr]
+    _search(pos, value, last)
 
     return expressions
 
@@ -247,29 +418,58 @@ def sanitize_parentheses(expression: str) -> list[str]:
     :return: The possible results
     """
 
-    def _validate_expression(expr: str):
+    def _remove(pos: int, level: int, rm_open: int, rm_close: int, kept_prev: bool) -> None:
+        """
+        Recursively decide for every parenthesis from pos on if it is kept or
+        removed and add all valid results to valid.
+
+        :param pos: The position of the next character in expression
+        :param level: The number of open parentheses in kept
+        :param rm_open: The number of ( still to remove
+        :param rm_close: The number of ) still to remove
+        :param kept_prev: If the previous character was kept
         """
-        Check if a parentheses expression is valid, ignoring everything
-        that is not a perenthesis.
 
-        :param expr: The expression to validate
+        if pos == len(expression):
+            if level == 0 and rm_open == rm_close == 0:
+                valid.append("".join(kept))
+            return
+
+        c = expression[pos]
+
+        # Within a run of equal parentheses, removing any k of them gives the
+        # same result, so only the first k are removed
+        if (c == "(" and rm_open or c == ")" and rm_close) and not (kept_prev and expression[pos - 1] == c):
+            _remove(pos + 1, level, rm_open - (c == "("), rm_close - (c == ")"), False)
+
+        if c == "(":
+            level += 1
+        elif c == ")":
+            if level == 0:
+                return
+            level -= 1
+
+        kept.append(c)
+        _remove(pos + 1, level, rm_open, rm_close, True)
+        kept.pop()
+
+    # Count the parentheses that need to be removed. Every ) without a
+    # matching ( and every ( left open at the end is one too many.
+    rm_open = rm_close = 0
+    for c in expression:
+        if c == "(":
+            rm_open += 1
+        elif c == ")":
+            if rm_open:
+                rm_open -= 1
+            else:
+                rm_close += 1
 
-        :return: If the expression is valid
-        """
-        level = 0
-        for c in expr:
-            if c == "(":
-                level += 1
-            elif c == ")":
-                if level <= 0:
-                    return False
-                level -= 1
-        return level == 0
-
-    for length in range(len(expression), -1, -1):
-        valid = list(set(filter(_validate_expression, map("".join, _itertools.combinations(expression, r=length)))))
-        if valid:
-            return valid
+    valid = []
+    kept = []
+    _remove(0, 0, rm_open, rm_close, False)
+
+    return valid
 
 
 def find_largest_prime_factor(number: int) -> int:
@@ -281,136 +481,202 @@ def find_largest_prime_factor(number: int) -> int:
     :return: The number's largest prime factor
     """
 
-    return _c_prime_fac(number)
+    if number < 0:
+        raise ValueError("number must not be negative")
 
+    try:
+        return _c_prime_fac(number)
+    # Number does not fit in 64 bits
+    except OverflowError:
+        return _largest_prime_factor(number)
 
-def encrypt_caesar(plain: str, offset: int) -> str:
+
+def _largest_prime_factor(number: int) -> int:
     """
-    Encrypt a string using caesar encryption with left shift by offset.
+    Find a number's largest prime factor using trial division for small
+    factors and Pollard's rho for large ones. This is the arbitrary
+    precision version of the C implementation.
 
-    :param plain: The plain text string
-    :param offset: The offset to shift by
+    :param number: The number
 
-    :return: The encrypted string
+    :return: The number's largest prime factor
     """
 
-    return encrypt_vigenere(plain, "".join(map(lambda c: chr((ord('A') if c.isupper() else ord('a')) + (-offset % 26)), plain)))
+    def _is_prime(n: int) -> bool:
+        """
+        Check if n is a prime using the Miller-Rabin test. The result is
+        certain for all numbers below 3.3 * 10^24.
 
+        :param n: The number to check
 
-def encrypt_vigenere(plain: str, key: str) -> str:
-    """
-    Encrypt a plain text string using vigenere.
+        :return: If n is a (probable) prime
+        """
 
-    :param plain: The plain text
-    :param key: The encryption key
+        bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
 
-    :return: The cyphertext
-    """
+        if n < 2:
+            return False
+        for b in bases:
+            if n % b == 0:
+                return n == b
+
+        d, s = n - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+
+        for b in bases:
+            x = pow(b, d, n)
+            if x in (1, n - 1):
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
 
-    def _encrypt_char(char: str, char_key: str) -> str:
+    def _pollard_rho(n: int) -> int:
         """
-        Encrypt a single character using vigenere.
+        Find a non-trivial factor of the odd composite n.
 
-        :param char: The character to encrypt
-        :param char_key: The encryption key
+        :param n: The number to factor
 
-        :return: The encrypted character
+        :return: A factor of n
         """
 
-        assert len(char) == len(char_key) == 1, "character and key must have length 1"
+        for c in _itertools.count(1):
+            x = y = 2
+            d = 1
+            while d == 1:
+                x = (x * x + c) % n
+                y = (y * y + c) % n
+                y = (y * y + c) % n
+                d = _math.gcd(x - y, n)
+            if d != n:
+                return d
+
+    def _largest_large_factor(n: int) -> int:
+        """
+        Find the largest prime factor of n, which has no small factors.
 
-        if not char.isalpha():
-            return char
+        :param n: The number
 
-        if char.isupper():
-            assert char_key.isupper(), "character and key must have same capitalization"
-            base = ord("A")
-        else:
-            assert char_key.islower(), "character and key must have same capitalization"
-            base = ord("a")
+        :return: n's largest prime factor
+        """
 
-        return chr((((ord(char) - base) + (ord(char_key) - base)) % 26) + base)
+        if n == 1 or _is_prime(n):
+            return n
+        d = _pollard_rho(n)
+        return max(_largest_large_factor(d), _largest_large_factor(n // d))
 
-    return "".join(map(lambda x: _encrypt_char(*x), zip(plain, _itertools.cycle(key))))
+    if number < 2:
+        return number
 
+    largest = number
+    p = 2
+    while p < 1024 and p * p <= number:
+        while number % p == 0:
+            largest = p
+            number //= p
+        p += 1 + (p > 2)
 
-def shortest_path_grid(grid: list[list[int]]) -> str:
-    """
-    Return the shortest path in a rectangular grid from the upper left to the
-    lower right corner.
+    # All remaining factors are larger than the ones found so far
+    if number == 1:
+        return largest
+    if number < 1024 * 1024:
+        return number
+    return _largest_large_factor(number)
 
-    :param grid: The grid as a 2-dimensional list, obstacles are denoted by
-    1, empty fields by 0
 
-    :return: The path as UDLR-string
+def encrypt_caesar(plain: str, offset: int) -> str:
     """
+    Encrypt a string using caesar encryption with left shift by offset.
 
-    def _generate_distance_grid(grid: list[list[int]]) -> list[list[int]]:
-        """
-        Generate grid of distances initialized with maximum possible distances
-        in grid.
+    :param plain: The plain text string
+    :param offset: The offset to shift by
 
-        :param grid: The original grid
+    :return: The encrypted string
+    """
 
-        :return: Grid of distances
-        """
+    return plain.translate(_SHIFT_TABLES[-offset % 26])
 
-        fields = sum(map(lambda row: len(row), grid))
 
-        return list(map(lambda x: [fields] * len(x), grid))
+def encrypt_vigenere(plain: str, key: str) -> str:
+    """
+    Encrypt a plain text string using vigenere.
 
-    def _get_shortest_path(grid: list[list[int]], distances: list[list[int]],
-                           path: list[tuple[int,int]] = [(0,0,)]) -> list[tuple[int,int]]:
-        """
-        Get shortest path from pos to lower right corner.
+    :param plain: The plain text
+    :param key: The encryption key
 
-        :param grid: The grid
-        :param distances: The distances to all fields in the grid
-        :param pos: The current path from the upper left corner to the current
-        position as a list of positions
+    :return: The cyphertext
+    """
 
-        :return: The shortest path as list of positions
-        """
+    # Without a key nothing can be encrypted
+    if not key:
+        return ""
+    if not (key.isalpha() and key.isascii()):
+        raise ValueError("key must only consist of letters")
 
-        pos = path[-1]
+    # All characters at the same position modulo the key length are shifted
+    # by the same key character, so they can be translated at once
+    cypher = list(plain)
+    for i, k in enumerate(key[:len(plain)]):
+        cypher[i::len(key)] = plain[i::len(key)].translate(_SHIFT_TABLES[ord(k.upper()) - ord("A")])
 
-        if pos == (len(grid) - 1,len(grid[-1]) - 1,):
-            return path
+    return "".join(cypher)
 
-        directions = [(0,1,),(1,0,),(0,-1,),(-1,0,)]
 
-        if distances[pos[0]][pos[1]] <= len(path):
-            return None
+def shortest_path_grid(grid: list[list[int]]) -> str:
+    """
+    Return the shortest path in a rectangular grid from the upper left to the
+    lower right corner.
 
-        distances[pos[0]][pos[1]] = len(path)
+    :param grid: The grid as a 2-dimensional list, obstacles are denoted by
+    1, empty fields by 0
 
-        min_path = None
-        for d in directions:
+    :return: The path as UDLR-string
+    """
 
-            pos = (path[-1][0] + d[0], path[-1][1] + d[1],)
-            if not (0 <= pos[0] < len(grid) and 0 <= pos[1] < len(grid[0])):
-                continue
-            if grid[pos[0]][pos[1]] == 1:
-                continue
+    assert len(set(map(lambda row: len(row), grid))) == 1, "grid must be rectangular"
 
-            p = _get_shortest_path(grid, distances, path + [pos])
-            if min_path is None or p is not None and len(p) < len(min_path):
-                min_path = p
+    rows, cols = len(grid), len(grid[0])
+    target = rows * cols - 1
 
-        return min_path
+    # Fields are numbered row by row. parents maps every visited field to
+    # the field it was first reached from, -1 if it has not been visited yet
+    blocked = bytes(field for row in grid for field in row)
+    parents = _array("i", [-1]) * (rows * cols)
+    parents[0] = 0
 
-    assert len(set(map(lambda row: len(row), grid))) == 1, "grid must be rectangular"
+    # Breadth first search, queue[head:] are the fields still to process
+    queue = _array("i", [0])
+    head = 0
+    while head < len(queue) and parents[target] == -1:
+        pos = queue[head]
+        head += 1
+        r, c = divmod(pos, cols)
 
-    distances = _generate_distance_grid(grid)
+        for n, valid in ((pos + 1, c + 1 < cols), (pos + cols, r + 1 < rows),
+                         (pos - 1, c > 0), (pos - cols, r > 0)):
+            if valid and not blocked[n] and parents[n] == -1:
+                parents[n] = pos
+                queue.append(n)
 
-    dir_map = {(0,1): "R", (0,-1): "L", (1,0): "D", (-1,0): "U"}
+    if parents[target] == -1:
+        return ""
 
-    path = _get_shortest_path(grid, distances) or []
-    dirs = ""
-    for i in range(len(path) - 1):
-        dirs += dir_map[(path[i + 1][0] - path[i][0], path[i + 1][1] - path[i][1],)]
+    # Walk back from the target, check vertical moves first as a horizontal
+    # step equals a vertical one in grids with a single column
+    dirs = []
+    pos = target
+    while pos != 0:
+        step = pos - parents[pos]
+        dirs.append("D" if step == cols else "U" if step == -cols else "R" if step == 1 else "L")
+        pos = parents[pos]
 
-    return dirs
+    return "".join(reversed(dirs))
 
 
 def generate_ips(base: str) -> list[str]:
@@ -423,38 +689,59 @@ def generate_ips(base: str) -> list[str]:
     :return: All valid generated IPs
     """
 
-    def _is_valid(ip: list[str]) -> bool:
+    def _octet_ends(start: int, remaining: int) -> list[int]:
         """
-        Check if ip is a valid IPv4.
+        Return the possible ends of a valid octet starting at start, leaving
+        enough digits for the remaining octets.
 
-        :param ip: The IP as list of individual parts
+        :param start: The octet's start in base
+        :param remaining: The number of octets following this one
 
-        :return: If the given IP is valid
+        :return: The possible (exclusive) ends of the octet
         """
-        return all(len(x) != 0 and not (x[0] == "0" and len(x) > 1) and 0 <= int(x) <= 255 for x in ip)
 
-    # If base cannot be split to valid IP
-    if not (4 <= len(base) <= 12):
-        return []
+        ends = []
+        for end in range(start + 1, min(start + 3, len(base)) + 1):
+            # Every following octet needs one to three digits
+            if not remaining <= len(base) - end <= 3 * remaining:
+                continue
+            # Leading zeroes are not allowed
+            if end - start > 1 and base[start] == "0":
+                break
+            if int(base[start:end]) > 255:
+                break
+            ends.append(end)
+        return ends
 
     # List to collect valid IPs
     valid: list[str] = []
 
-    # For all possibilities to split base in 4 parts
-    for inds in _itertools.combinations(range(1,len(base)), r=3):
-        # Split base by indices
-        inds += (len(base),)
-        ip: str = [base[0:inds[0]]]
-        for i in range(3):
-            ip.append(base[inds[i]:inds[i+1]])
+    # If base cannot be split to valid IP
+    if not (4 <= len(base) <= 12):
+        return valid
 
-        # Append ip to valid, if it is valid
-        if _is_valid(ip):
-            valid.append(".".join(ip))
+    # Split points in ascending order
+    for i in _octet_ends(0, 3):
+        for j in _octet_ends(i, 2):
+            for k in _octet_ends(j, 1):
+                if _octet_ends(k, 0):
+                    valid.append(f"{base[:i]}.{base[i:j]}.{base[j:k]}.{base[k:]}")
 
     return valid
 
 
+def generate_ips_many(bases: _Iterable[str]) -> list[list[str]]:
+    """
+    Generate all valid IPv4s for many strings of digits.
+
+    :param bases: The strings with digits to generate the IPs from
+
+    :return: All valid generated IPs for every base
+    """
+
+    return [generate_ips(b) for b in bases]
+
+
 def total_ways_sum(target: int, nums: _Iterable[int] = None) -> int:
     """
     Return the number of distinct ways to write target as a sum.
@@ -468,45 +755,42 @@ def total_ways_sum(target: int, nums: _Iterable[int] = None) -> int:
     :return: The number of distinct summands from nums equaling target
     """
 
-    def _total_ways_sum(target: int, nums: _Iterable[int]) -> int:
-        """
-        Recursively compute the total number of distinct ways to write
-        target as a sum of integers from nums.
-
-        :param target: The sum target
-        :param nums: The numbers to choose from for the sum
-
-        :return: The number of distinct summands from nums equaling target
-        """
-
-        if not hasattr(_total_ways_sum, "cache"):
-            _total_ways_sum.cache = {}
-
-        if target < 0:
-            return 0
-        elif target == 0:
-            return 1
+    return total_ways_sums((target,), nums)[0]
 
-        num = 0
-        nums = tuple(sorted(nums, reverse=True))
 
-        if (n := _total_ways_sum.cache.get((target, nums,), None)) is not None:
-            return n
+def total_ways_sums(targets: _Iterable[int], nums: _Iterable[int] = None) -> list[int]:
+    """
+    Return the number of distinct ways to write each of the targets as a sum.
+    All targets are answered from a single table, so this is as fast as
+    answering the largest target alone.
+    If num is kept at the default, a target itself will not be counted as
+    a valid solution. If nums is explicitely specified and contains a
+    target, it will be counted as a solution.
 
-        for n in nums:
-            num += _total_ways_sum(target - n, filter(lambda x: x <= n, nums))
+    :param targets: The sum targets
+    :param nums: The numbers to choose for the sum. Default is all positive integers
 
-        _total_ways_sum.cache[(target, nums,)] = num
+    :return: The number of distinct summands from nums equaling each target
+    """
 
-        return num
+    targets = list(targets)
+    max_target = max(targets, default=0)
 
-    if nums is None:
-        nums = range(target - 1, 0, -1)
+    default = nums is None
+    if default:
+        nums = range(1, max_target + 1)
+    nums = sorted(n for n in set(nums) if 0 < n <= max_target)
 
-    num = _total_ways_sum(target, set(nums))
-    del _total_ways_sum.cache
+    # ways[t] is the number of ways to write t as a sum of the numbers
+    # processed so far. Processing the numbers one after another counts every
+    # combination only once, regardless of the order of its summands.
+    ways = [1] + [0] * max_target
+    for n in nums:
+        for t in range(n, max_target + 1):
+            ways[t] += ways[t - n]
 
-    return num
+    # By default, the target itself is no valid sum but has been counted
+    return [0 if t < 0 else ways[t] - (default and t > 0) for t in targets]
 
 
 def spiralize_matrix(matrix: list[list[int]]) -> list[int]:
@@ -519,59 +803,103 @@ def spiralize_matrix(matrix: list[list[int]]) -> list[int]:
     :return: The spiralized matrix as a one dimensional list
     """
 
-    def _pop_col(matrix: list[list[int]], n: int) -> list[int]:
-        """
-        Remove the n-th column from matrix and return it.
+    return list(iter_spiral(matrix))
 
-        :param matrix: The matrix
-        :param n: Column number
 
-        :return: The n-th column from matrix
-        """
+def iter_spiral(matrix: list[list[int]]) -> _Iterator[int]:
+    """
+    Iterate over a two dimensional matrix in spiral order without copying or
+    modifying it.
 
-        col = []
-        i = 0
-        while i < len(matrix):
-            col.append(matrix[i].pop(n))
-            if not matrix[i]:
-                matrix.pop(i)
-            else:
-                i += 1
-        return col
-
-    spiral = []
-    functions = [lambda m: m.pop(0), # Pop and return first row
-                 lambda m: _pop_col(m, -1), # Pop and return last column
-                 lambda m: m.pop(-1)[::-1], # Pop and return last row reversed
-                 lambda m: _pop_col(matrix, 0)[::-1]] # Pop and return first column reversed
-    i = 0
-    while matrix:
-        spiral += functions[i % 4](matrix)
-        i += 1
+    :param matrix: The matrix to spiralize
+
+    :return: An iterator over the matrix' elements in spiral order
+    """
+
+    if not matrix:
+        return
+
+    # Bounds of the part of the matrix not yet visited, bottom and right
+    # are exclusive
+    top, bottom, left, right = 0, len(matrix), 0, len(matrix[0])
+
+    while top < bottom and left < right:
+        # First row
+        yield from matrix[top][left:right]
+        top += 1
+
+        # Last column
+        for r in range(top, bottom):
+            yield matrix[r][right - 1]
+        right -= 1
 
-    return spiral
+        if top < bottom:
+            # Last row reversed
+            row = matrix[bottom - 1]
+            for c in range(right - 1, left - 1, -1):
+                yield row[c]
+            bottom -= 1
 
+        if left < right:
+            # First column reversed
+            for r in range(bottom - 1, top - 1, -1):
+                yield matrix[r][left]
+            left += 1
 
-def min_path_sum_triangle(triangle: list[list[int]], pos: tuple[int] = (0,0,)) -> int:
+
+def min_path_sum_triangle(triangle: list[list[int]]) -> int:
     """
     Return the minimal path sum from the top of the triangle to the bottom
     when only moving to adjacent fields in the row below for every step.
 
     :param triangle: The triangle to move in
-    :param pos: The current position (default is the top)
 
     :return: The minimal path sum
     """
 
-    cur_sum = triangle[pos[0]][pos[1]]
+    # Minimal path sums from every field of the current row to the bottom
+    sums = list(triangle[-1])
+
+    for r in range(len(triangle) - 2, -1, -1):
+        row = triangle[r]
+        for i in range(len(row)):
+            sums[i] = row[i] + min(sums[i], sums[i + 1])
+
+    return sums[0]
+
+
+def min_path_triangle(triangle: list[list[int]]) -> tuple[int, list[int]]:
+    """
+    Return the minimal path sum from the top of the triangle to the bottom
+    and the path itself when only moving to adjacent fields in the row below
+    for every step.
+
+    :param triangle: The triangle to move in
+
+    :return: The minimal path sum and the path's position in every row
+    """
+
+    # Minimal path sums from every field of the current row to the bottom
+    sums = list(triangle[-1])
+    # For every field above the bottom row, if the minimal path continues
+    # to the right (1) or straight down (0), stored row after row
+    right = bytearray(len(triangle) * (len(triangle) - 1) // 2)
+
+    for r in range(len(triangle) - 2, -1, -1):
+        row = triangle[r]
+        offset = r * (r + 1) // 2
+        for i in range(len(row)):
+            if sums[i + 1] < sums[i]:
+                right[offset + i] = 1
+                sums[i] = row[i] + sums[i + 1]
+            else:
+                sums[i] = row[i] + sums[i]
 
-    # If we reached the bottom, return the current field's value
-    if pos[0] == len(triangle) - 1:
-        return triangle[pos[0]][pos[1]]
+    path = [0]
+    for r in range(len(triangle) - 1):
+        path.append(path[-1] + right[r * (r + 1) // 2 + path[-1]])
 
-    return (triangle[pos[0]][pos[1]]
-            + min(min_path_sum_triangle(triangle, (pos[0] + 1, pos[1],)),
-                  min_path_sum_triangle(triangle, (pos[0] + 1, pos[1] + 1,))))
+    return sums[0], path
 
 
 def subarray_max_sum(array: list[int]):
@@ -584,32 +912,75 @@ def subarray_max_sum(array: list[int]):
     :return: The sum of the sub array with the largest sum
     """
 
-    # If all values in the array are negative, return the largest one
-    if not tuple(filter(lambda n: n > 0, array)):
-        return max(array)
+    return subarray_max(array)[0]
 
-    max_sum = 0
-    for i in range(len(array)):
-        # Skip negative values as sub array start
-        if array[i] <= 0:
-            continue
 
-        s = 0
-        # All sub arrays from index i to end
-        for j in range(i, len(array)):
-            # Keep track of sum in sub array
-            s += array[j]
+def subarray_max(array: list[int]) -> tuple[int, int, int]:
+    """
+    Find the contiguous sub array with the largest sum in array using
+    Kadane's algorithm. The sub array must contain at least one element.
 
-            # If sum of sub array is negative, it cannot be or become
-            # the largest sum
-            if s <= 0:
-                break
+    :param array: The array to chose the sub arrays from.
+
+    :return: The sum of the sub array with the largest sum, its start index
+    and its end index (exclusive)
+    """
+
+    best = (array[0], 0, 1)
+    # Largest sum of a sub array ending at the current index and its start
+    cur, start = 0, 0
+    for i, n in enumerate(array):
+        # A sub array with a negative sum never improves a following one
+        if cur < 0:
+            cur, start = 0, i
+        cur += n
+
+        if cur > best[0]:
+            best = (cur, start, i + 1)
+
+    return best
+
+
+def subarray_max_sums(arrays: _Iterable[list[int]]) -> list[int]:
+    """
+    Find the largest sums of contiguous sub arrays for many arrays at once.
+    If NumPy is available and the sums fit into 64 bit integers, all arrays
+    are processed in a single vectorized pass over their prefix sums.
+
+    :param arrays: The arrays to chose the sub arrays from, none may be empty
+
+    :return: The largest sub array sum for every array
+    """
+
+    arrays = list(arrays)
+    if _np is None or not arrays:
+        return [subarray_max_sum(a) for a in arrays]
 
-            # New largest sum of sub array
-            if s > max_sum:
-                max_sum = s
+    lengths = _np.array([len(a) for a in arrays])
+    values = _np.zeros((len(arrays), lengths.max()), dtype=_np.int64)
+    try:
+        for i, a in enumerate(arrays):
+            values[i, :len(a)] = a
+    except OverflowError:
+        return [subarray_max_sum(a) for a in arrays]
 
-    return max_sum
+    # Differences of prefix sums are bounded by twice the largest absolute
+    # value times the longest length, beyond int64 they would silently wrap
+    largest = max(int(values.max()), -int(values.min()))
+    if 2 * largest * int(lengths.max()) >= 1 << 63:
+        return [subarray_max_sum(a) for a in arrays]
+
+    # The best sub array ending at j has the sum of the prefix up to j minus
+    # the smallest prefix before it
+    prefix = _np.zeros((len(arrays), values.shape[1] + 1), dtype=_np.int64)
+    _np.cumsum(values, axis=1, out=prefix[:, 1:])
+    sums = prefix[:, 1:] - _np.minimum.accumulate(prefix[:, :-1], axis=1)
+
+    # Ignore sub arrays ending in the padding after shorter arrays
+    padding = _np.arange(values.shape[1]) >= lengths[:, None]
+    sums[padding] = _np.iinfo(_np.int64).min
+
+    return sums.max(axis=1).tolist()
 
 
 def unique_paths_grid_I(width, height) -> int:
@@ -623,113 +994,158 @@ def unique_paths_grid_I(width, height) -> int:
     :return: The number of unique paths
     """
 
-    # Larger number is always height
-    if width < height:
-        return unique_paths_grid_I(height, width)
-
-    if height <= 0:
+    if width <= 0 or height <= 0:
         return 0
-    elif height == 1:
-        return 1
-
-    num_paths = 0
-    for h in range(height, 0, -1):
-        num_paths += unique_paths_grid_I(width - 1, h)
 
-    return num_paths
+    # Every path consists of width - 1 moves right and height - 1 moves down,
+    # paths only differ in which of the moves go down
+    return _math.comb(width + height - 2, height - 1)
 
 
-def unique_paths_grid_II(grid: list[list[int]], pos: tuple[int,int] = (0,0,)) -> int:
+def unique_paths_grid_II(grid: list[list[int]]) -> int:
     """
     Return the number of unique paths in the grid from the top left corner
     to the top right corner while only moving right and down.
     The grid consists of 1s and 0s. 0s are empty fields, 1s are obstacles.
 
     :param grid: The grid to walk through
-    :param pos: The current position. Used for recursion
 
     :return: The number of unique paths
     """
 
-    # If we reached the bottom left corner, a path was found
-    if pos == (len(grid) - 1, len(grid[-1]) - 1,):
-        return 1
-    # If we reached a dead end
-    if pos[0] >= len(grid) or pos[1] >= len(grid[pos[0]]) or grid[pos[0]][pos[1]] == 1:
-        return 0
+    # Number of paths to every field of the current row
+    paths = [0] * len(grid[0])
+    paths[0] = 1
+
+    for row in grid:
+        for i, field in enumerate(row):
+            if field == 1:
+                paths[i] = 0
+            elif i > 0:
+                paths[i] += paths[i - 1]
 
-    return (unique_paths_grid_II(grid, (pos[0] + 1, pos[1]))
-            + unique_paths_grid_II(grid, (pos[0], pos[1] + 1)))
+    return paths[-1]
 
 
-def merge_overlapping_intervals(intervals: list[list[int]]) -> list[list[int]]:
+def merge_overlapping_intervals(intervals: _Iterable[list[int]]) -> list[list[int]]:
     """
     Merge overlapping intervals from list and return result in ascending order.
+    The given intervals are not modified.
 
     :param intervals: The intervals to merge
     """
 
-    intervals = sorted(intervals)
-    res = [intervals[0]]
+    intervals = list(intervals)
+    # Only sort if necessary, checking is linear
+    if any(intervals[i + 1] < intervals[i] for i in range(len(intervals) - 1)):
+        intervals.sort()
 
-    for inv in intervals:
-        if inv[0] <= res[-1][1]:
-            res[-1][1] = max(res[-1][1], inv[1])
+    res = []
+    for start, end in intervals:
+        if res and start <= res[-1][1]:
+            res[-1][1] = max(res[-1][1], end)
         else:
-            res.append(inv)
+            res.append([start, end])
 
     return res
 
 
-def lz_decompression(compressed: str) -> str:
+class IntervalSet:
     """
-    Decompress an LZ-compressed string and return the plain text.
+    Set of disjoint intervals to incrementally merge intervals into.
+    The intervals are kept in sorted arrays, so finding the intervals to
+    merge with takes O(log n).
+    """
+
+    def __init__(self, intervals: _Iterable[list[int]] = ()):
+        """
+        :param intervals: The intervals to initially merge
+        """
 
-    :param compressed: The compressed string
+        merged = merge_overlapping_intervals(intervals)
+        self._starts = [i[0] for i in merged]
+        self._ends = [i[1] for i in merged]
 
-    :return: The plain text
-    """
+    def insert(self, start: int, end: int) -> None:
+        """
+        Insert an interval, merging it with all overlapping intervals.
 
-    def _append_offset(text: str, offset: int, length: int) -> str:
+        :param start: The interval's start
+        :param end: The interval's end
         """
-        Append characters to text from offset in text.
 
-        :param text: The base text
-        :param offset: The position of the first character from the end
-        of text
-        :param length: The length of the string to append
+        # Intervals i to j - 1 overlap the new one
+        i = _bisect.bisect_left(self._ends, start)
+        j = _bisect.bisect_right(self._starts, end)
 
-        :return: text with the appended string
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+
+    def query(self, point: int) -> list[int] | None:
         """
+        Find the interval containing a point.
 
-        for i in range(len(text) - offset, len(text) - offset + length):
-            text += text[i]
+        :param point: The point to find the interval for
 
-        return text
+        :return: The interval containing point or None if there is none
+        """
 
-    plain = ""
-    i = 0
-    chunk = 0
-    while i < len(compressed):
-        # Length of zero means skip chunk
-        if compressed[i] == "0":
-            i += 1
-            chunk = not chunk
-            continue
+        i = _bisect.bisect_right(self._starts, point) - 1
+        if i >= 0 and point <= self._ends[i]:
+            return [self._starts[i], self._ends[i]]
+        return None
+
+    def __iter__(self) -> _Iterator[list[int]]:
+        return ([s, e] for s, e in zip(self._starts, self._ends))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+
+def lz_decompression(compressed: _Iterable[str]) -> str:
+    """
+    Decompress an LZ-compressed string and return the plain text.
+
+    :param compressed: The compressed string or an iterable yielding its
+    characters
+
+    :return: The plain text
+    """
+
+    chars = iter(compressed)
+    plain = []
+    copy_chunk = True
+    for c in chars:
+        length = int(c)
 
+        # Length of zero means skip chunk
+        if length == 0:
+            pass
         # Simply copy length chars from compressed data to plain
-        if not chunk:
-            plain += compressed[i + 1:i + 1 + int(compressed[i])]
-            i += int(compressed[i]) + 1
+        elif copy_chunk:
+            plain.extend(_itertools.islice(chars, length))
         # Repeat length chars from previous occurrence in plain
         else:
-            plain = _append_offset(plain, int(compressed[i + 1]),
-                                   int(compressed[i]))
-            i += 2
+            offset = int(next(chars))
+            if not 0 < offset <= len(plain):
+                raise ValueError(f"Invalid offset {offset} at plain text position {len(plain)}")
+
+            start = len(plain) - offset
+            if offset >= length:
+                plain.extend(plain[start:start + length])
+            # The repeated part overlaps itself, so it is copied one
+            # character at a time
+            else:
+                for i in range(start, start + length):
+                    plain.append(plain[i])
 
-        chunk = not chunk
+        copy_chunk = not copy_chunk
 
-    return plain
+    return "".join(plain)
 
 
 def old_lz_compression(plain: str) -> str:
@@ -795,144 +1211,198 @@ def old_lz_compression(plain: str) -> str:
     #return "".join(map(str, compressed))
 
 
-def lz_compression(plain: str, part_comp: list[int|str] = [0], index: int = 0, block_start: int = 0) -> str:
+def lz_compression(plain: str) -> str:
     """
-    Recursive function for LZ compression. This function is slower but always
-    generates optimal results.
+    Compress a string using LZ compression. This function always generates
+    optimal results.
 
     :param plain: The plain string to compress
-    :param part_comp: Partial compression of string, used for recursion
-    :param index: Current index in plain, used for recursion
-    :param block_start: Start of current compression block, used for recursion
 
     :return: The LZ compressed string
     """
 
-    def _longest_prev_occ(text: str, pos: int) -> tuple[int,int]:
+    def _append(state: list[list[tuple|None]], offset: int, length: int, node: tuple) -> None:
         """
-        Return the length and offset for the longest substring starting
-        from pos having an occurrence starting from a position before pos.
-
-        :param text: The text to search the substring in
-        :param pos: The start of the substring to find
+        Store node as the state with a block of the given offset and length
+        being written, if it is shorter than the currently stored one.
 
-        :return: The length and the offset (from the end) of the found
-        substring
+        :param state: The states to update
+        :param offset: The offset of the current type 2 block, 0 for a type 1 block
+        :param length: The current block's length
+        :param node: The compression until the current block
         """
 
-        for end in range(len(text), pos - 1, -1):
-            # TODO: Maybe find last appicable occurrence instead of first
-            if (i := text.find(text[pos:end], max(0, pos - 9))) != -1 and i < pos:
-                return (end - pos, pos - i,)
+        if state[offset][length] is None or node[0] < state[offset][length][0]:
+            state[offset][length] = node
 
-        return (0,0)
+    if not plain:
+        return ""
 
-    # If plain is already fully compressed, return compressed string
-    if index == len(plain):
-        # If compression contains trailing 0, remove it
-        if part_comp[-1] == 0:
-            part_comp.pop()
-        return "".join(map(str, part_comp))
-        #return part_comp
-
-    # Dummy strings with length always >= compressed version to allow
-    # graceful return of shorter version
-    c1 = c2 = "0" * (len(plain) * 2 + 1)
-
-    # Version 1: If copy-block is not exhausted, append character and recurse from there
-    if part_comp[block_start] < 9:
-        p = list(part_comp)
-        p[block_start] += 1
-        p.append(plain[index])
-
-        c1 = lz_compression(plain, p, index + 1, block_start)
-
-    # Version 2: If copy block is exhausted or repeat-block might be better, add repeat
-    # block and recurse from there
-    if (prev := _longest_prev_occ(plain, index))[0] >= 2 or part_comp[block_start] == 9:
-        p = list(part_comp)
-        prev = (min(prev[0], 9), prev[1])
-        if prev[0] == 0:
-            p.append(0)
-        else:
-            p += list(prev)
-        p.append(0)
+    # The offsets at which a type 2 block can copy each character
+    matches = [[o for o in range(1, min(9, i) + 1) if plain[i - o] == plain[i]] for i in range(len(plain))]
+
+    # state[offset][length] is the shortest compression of plain up to the
+    # current character, with a block of the given length containing it
+    # still being written. Offset 0 denotes a type 1 block, other offsets
+    # type 2 blocks. The compression before the current block is stored as
+    # node (length, previous node, appended string) to avoid copying strings.
+    state = [[None] * 10 for _ in range(10)]
+    state[0][1] = (0, None, "")
+
+    for i in range(1, len(plain)):
+        new_state = [[None] * 10 for _ in range(10)]
+
+        for length in range(1, 10):
+            if (node := state[0][length]) is None:
+                continue
+
+            # Extend the type 1 block or end it and start a new one
+            if length < 9:
+                _append(new_state, 0, length + 1, node)
+            else:
+                piece = f"9{plain[i - 9:i]}0"
+                _append(new_state, 0, 1, (node[0] + len(piece), node, piece))
+
+            # End the type 1 block and start a type 2 block
+            piece = f"{length}{plain[i - length:i]}"
+            for offset in matches[i]:
+                _append(new_state, offset, 1, (node[0] + len(piece), node, piece))
+
+        for offset in range(1, 10):
+            for length in range(1, 10):
+                if (node := state[offset][length]) is None:
+                    continue
+
+                # Extend the type 2 block or end it and start a new one
+                # with the same offset
+                if plain[i - offset] == plain[i]:
+                    if length < 9:
+                        _append(new_state, offset, length + 1, node)
+                    else:
+                        _append(new_state, offset, 1, (node[0] + 3, node, f"9{offset}0"))
+
+                # End the type 2 block and start a type 1 block
+                _append(new_state, 0, 1, (node[0] + 2, node, f"{length}{offset}"))
+
+                # End the type 2 block and start one with another offset
+                for new_offset in matches[i]:
+                    _append(new_state, new_offset, 1, (node[0] + 3, node, f"{length}{offset}0"))
 
-        c2 = lz_compression(plain, p, index + prev[0], len(p) - 1)
+        state = new_state
 
-    # Return shorter version
-    if len(c1) == len(c2) == len(plain) * 2:
-        raise RuntimeError("Could not find valid compression")
-    if len(c2) < len(c1):
-        return c2
-    return c1
+    # End the last block
+    ends = [(node[0] + 1 + length, node, f"{length}{plain[len(plain) - length:]}")
+            for length, node in enumerate(state[0]) if node is not None]
+    ends += [(node[0] + 2, node, f"{length}{offset}")
+             for offset in range(1, 10) for length, node in enumerate(state[offset]) if node is not None]
+    node = min(ends, key=lambda n: n[0])
 
+    pieces = []
+    while node is not None:
+        pieces.append(node[2])
+        node = node[1]
 
-def two_color(vertex_num: int, edges: list[tuple[int,int]]) -> list[int] | None:
+    return "".join(reversed(pieces))
+
+
+def two_color(vertex_num: int, edges: list[tuple[int,int]]) -> list[int]:
     """
     Create a two coloring for a given graph.
 
     :param vertex_num: The number of vertices in the graph
     :param edges: The graph's edges as an edge list
 
-    :return: A proper two coloring for the graph or None if none exists
+    :return: A proper two coloring for the graph or an empty list if none exists
     """
 
-    def _color_from(root: int, edges: list[list[int]], colors: list[bool|None]) -> bool:
-        """
-        Create partial two coloring from already colored root vertice.
-        This function colors all vertices connected to root directly or
-        indirectly using depth first search.
+    return two_color_or_odd_cycle(vertex_num, edges)[0]
 
-        :param root: The root vertice to color from
-        :param edges: The graph's edges
-        :param colors: List of colors for all vertices
-        """
 
-        # For all vertices directly connected to root
-        for v in edges[root]:
-            # If it has the same color as root, no proper two coloring is
-            # possible
-            if colors[v] == colors[root]:
-                return False
-            # If it already has the necessary color, it has already been
-            # processed, so continue
-            elif colors[v] is not None:
-                continue
+def two_color_or_odd_cycle(vertex_num: int, edges: _Iterable[tuple[int,int]]) -> tuple[list[int], list[int]]:
+    """
+    Create a two coloring for a given graph or find an odd cycle proving
+    that none exists. Self loops are ignored.
 
-            colors[v] = not colors[root]
-            # Recurse by using v as root
-            if not _color_from(v, edges, colors):
-                return False
+    :param vertex_num: The number of vertices in the graph
+    :param edges: The graph's edges as an edge list
 
-        return True
+    :return: A proper two coloring and an empty list, or an empty list and
+    the vertices of an odd cycle in the order they are connected
+    """
 
     if vertex_num <= 0:
-        return []
+        return [], []
 
-    # Generate a list mapping all vertices to their direct neighbors
-    vertex_edges = [set() for _ in range(vertex_num)]
-    for e in edges:
-        if e[0] == e[1]:
-            continue
-
-        vertex_edges[e[0]].add(e[1])
-        vertex_edges[e[1]].add(e[0])
-    # Initialize color list for vertices
-    colors = [None for _ in range(vertex_num)]
+    edges = [e for e in edges if e[0] != e[1]]
 
+    # Compressed sparse row adjacency: the neighbors of vertex v are
+    # neighbors[offsets[v]:offsets[v + 1]]
+    offsets = _array("q", [0]) * (vertex_num + 1)
+    for u, v in edges:
+        offsets[u + 1] += 1
+        offsets[v + 1] += 1
     for v in range(vertex_num):
-        # If vertice is already colored, it has already been processed, so
-        # continue
-        if colors[v] is not None:
+        offsets[v + 1] += offsets[v]
+
+    neighbors = _array("i", [0]) * offsets[vertex_num]
+    fill = offsets[:-1]
+    for u, v in edges:
+        neighbors[fill[u]] = v
+        fill[u] += 1
+        neighbors[fill[v]] = u
+        fill[v] += 1
+
+    # Color every connected component by breadth first search from its
+    # lowest vertex, remembering the vertex every vertex was reached from
+    colors = _array("b", [-1]) * vertex_num
+    parents = _array("i", [-1]) * vertex_num
+    queue = _array("i")
+    for root in range(vertex_num):
+        if colors[root] != -1:
             continue
 
-        # If the vertice is not colored yet, it is not connected to any
-        # vertice with a lower index. Therefore, its color can be chosen freely
-        # and all nodes connected to it can be colored accordingly
-        colors[v] = 0
-        if not _color_from(v, vertex_edges, colors):
-            return []
+        colors[root] = 0
+        queue.append(root)
+        head = len(queue) - 1
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+
+            for i in range(offsets[u], offsets[u + 1]):
+                v = neighbors[i]
+                if colors[v] == -1:
+                    colors[v] = 1 - colors[u]
+                    parents[v] = u
+                    queue.append(v)
+                # Both ends of the edge have the same distance from the root
+                # modulo 2, so the paths from the root and the edge form an
+                # odd cycle
+                elif colors[v] == colors[u]:
+                    return [], _odd_cycle(parents, u, v)
+
+    return list(colors), []
+
+
+def _odd_cycle(parents: _array, u: int, v: int) -> list[int]:
+    """
+    Return the cycle formed by the edge between u and v and their paths
+    in the search tree.
+
+    :param parents: The vertex every vertex was reached from, -1 for roots
+    :param u: The first vertex of the edge
+    :param v: The second vertex of the edge
+
+    :return: The cycle's vertices from u to v via their lowest common
+    ancestor
+    """
+
+    path_u = [u]
+    while parents[path_u[-1]] != -1:
+        path_u.append(parents[path_u[-1]])
+    ancestors = {w: i for i, w in enumerate(path_u)}
+
+    path_v = [v]
+    while path_v[-1] not in ancestors:
+        path_v.append(parents[path_v[-1]])
 
-    # Convert booleans to ints
-    return list(map(int, colors))
+    return path_u[:ancestors[path_v[-1]] + 1] + path_v[-2::-1]
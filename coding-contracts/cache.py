@@ -0,0 +1,147 @@
+from __future__ import annotations as _annotations
+from collections import OrderedDict as _OrderedDict
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from hashlib import sha256 as _sha256
+from typing import Any as _Any
+import json as _json
+import sqlite3 as _sqlite3
+import time as _time
+
+
+def contract_key(c_type: str, data: _Any, version: str = "") -> str:
+    """
+    Create a key identifying a contract by its type and content. Equal data
+    always results in the same key, regardless of dict ordering or
+    whitespace.
+
+    :param c_type: The coding contract type
+    :param data: The contract's data
+    :param version: The solvers' version, so answers of other versions are
+    not reused
+
+    :return: The contract's key
+    """
+
+    canonical = _json.dumps([version, c_type, data], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    LRU cache for contract answers with a maximum size and time to live.
+    The cache can optionally be persisted to an sqlite database, so it
+    survives restarts. Database writes run in a background thread, so they
+    do not block the caller.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 7 * 24 * 60 * 60, path: str | None = None):
+        """
+        :param max_size: The maximum number of cached answers
+        :param ttl: The number of seconds after which cached answers expire
+        :param path: The sqlite database file to persist the cache in, or
+        None to only keep the cache in memory
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        # Maps keys to (creation time, answer), least recently used first
+        self._entries: _OrderedDict[str, tuple[float, _Any]] = _OrderedDict()
+
+        self._db = None
+        # Single thread running all database writes after loading, so they
+        # are applied in order
+        self._writer = None
+        if path is not None:
+            self._db = _sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, created REAL, answer TEXT)")
+            self._db.execute("DELETE FROM results WHERE created < ?", (_time.time() - ttl,))
+            # Load the newest entries, oldest first, so the newest ones are
+            # the last to be evicted
+            rows = self._db.execute("SELECT key, created, answer FROM results ORDER BY created DESC LIMIT ?",
+                                    (max_size,)).fetchall()
+            for key, created, answer in reversed(rows):
+                self._entries[key] = (created, _json.loads(answer))
+            self._db.execute("DELETE FROM results WHERE key NOT IN (SELECT key FROM results ORDER BY created DESC LIMIT ?)",
+                             (max_size,))
+            self._db.commit()
+            self._writer = _ThreadPoolExecutor(max_workers=1)
+
+    def get(self, key: str) -> tuple[bool, _Any]:
+        """
+        Look up a cached answer.
+
+        :param key: The contract's key
+
+        :return: If the answer was cached and the answer itself
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] + self.ttl < _time.time():
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return True, entry[1]
+
+    def put(self, key: str, answer: _Any) -> None:
+        """
+        Cache an answer, evicting the least recently used answer if the
+        cache is full.
+
+        :param key: The contract's key
+        :param answer: The answer to cache, must be JSON-serializable
+        """
+
+        if self.max_size <= 0:
+            return
+
+        created = _time.time()
+        self._entries[key] = (created, answer)
+        self._entries.move_to_end(key)
+
+        if self._db is not None:
+            self._writer.submit(self._write, "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                                (key, created, _json.dumps(answer)))
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the cache's hit and miss counters and its current size.
+
+        :return: The cache statistics
+        """
+
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "max_size": self.max_size}
+
+    def _remove(self, key: str) -> None:
+        """
+        Remove an entry from the cache.
+
+        :param key: The key of the entry to remove
+        """
+
+        del self._entries[key]
+        if self._db is not None:
+            self._writer.submit(self._write, "DELETE FROM results WHERE key = ?", (key,))
+
+    def _write(self, sql: str, params: tuple) -> None:
+        """
+        Execute and commit a database write. Only called by the writer
+        thread.
+
+        :param sql: The SQL statement
+        :param params: The statement's parameters
+        """
+
+        self._db.execute(sql, params)
+        self._db.commit()
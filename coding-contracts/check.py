@@ -0,0 +1,171 @@
+from argparse import ArgumentParser
+import random
+import sys
+
+import bitburner
+import reference
+
+
+def check_stock(rng: random.Random, count: int) -> list[str]:
+    """
+    Compare algorithmic_stock against the reference implementation on random
+    prices and numbers of transactions.
+
+    :param rng: The random number generator
+    :param count: The number of inputs to check
+
+    :return: Descriptions of all inputs the implementations disagree on
+    """
+
+    failures = []
+    for _ in range(count):
+        # The reference implementation is exponential in the number of prices
+        prices = [rng.randint(1, rng.choice((5, 50, 200))) for _ in range(rng.randint(0, 9))]
+        num_transactions = rng.randint(0, 6)
+
+        fast = bitburner.algorithmic_stock(prices, num_transactions)
+        ref = reference.algorithmic_stock(prices, num_transactions)
+        if fast != ref:
+            failures.append(f"algorithmic_stock({prices}, {num_transactions}): {fast} != {ref}")
+
+    return failures
+
+
+def check_lz_compression(rng: random.Random, count: int) -> list[str]:
+    """
+    Check that lz_compression's output decompresses to the plain text and is
+    no longer than the reference implementation's on random texts with
+    repetitions.
+
+    :param rng: The random number generator
+    :param count: The number of inputs to check
+
+    :return: Descriptions of all inputs lz_compression fails on
+    """
+
+    failures = []
+    for _ in range(count):
+        # The reference implementation is exponential in the text's length
+        alphabet = "abcdefghij"[:rng.randint(1, 10)]
+        length = rng.randint(0, 20)
+        plain = ""
+        while len(plain) < length:
+            if plain and rng.random() < 0.5:
+                start = rng.randrange(len(plain))
+                plain += plain[start:start + rng.randint(1, 12)]
+            else:
+                plain += rng.choice(alphabet)
+        plain = plain[:length]
+
+        fast = bitburner.lz_compression(plain)
+        ref = reference.lz_compression(plain, [0])
+        if bitburner.lz_decompression(fast) != plain:
+            failures.append(f"lz_compression({plain!r}): {fast!r} does not decompress to the plain text")
+        elif len(fast) > len(ref):
+            failures.append(f"lz_compression({plain!r}): {fast!r} is longer than {ref!r}")
+
+    return failures
+
+
+def check_hamming(rng: random.Random, count: int) -> list[str]:
+    """
+    Check the hamming functions exhaustively on all 16 bit integers. Encoding
+    is compared against the reference implementation and decoding has to
+    recover the integer from its code and from the code with any single bit
+    flipped. Decoding is compared against the reference implementation on
+    one randomly flipped bit per code.
+
+    :param rng: The random number generator
+    :param count: Unused, all 16 bit integers are checked
+
+    :return: Descriptions of all inputs the hamming functions fail on
+    """
+
+    failures = []
+    for num in range(1 << 16):
+        code = bitburner.hamming_i2b(num)
+        ref = reference.hamming_i2b(num)
+        if code != ref:
+            failures.append(f"hamming_i2b({num}): {code} != {ref}")
+            continue
+
+        flips = [code] + [code[:i] + "10"[int(code[i])] + code[i + 1:] for i in range(len(code))]
+        for flipped in flips:
+            if (decoded := bitburner.hamming_b2i(flipped)) != num:
+                failures.append(f"hamming_b2i({flipped}): {decoded} != {num}")
+
+        i = rng.randrange(len(code))
+        flipped = code[:i] + "10"[int(code[i])] + code[i + 1:]
+        if (decoded := bitburner.hamming_b2i(flipped)) != (ref := reference.hamming_b2i(flipped)):
+            failures.append(f"hamming_b2i({flipped}): {decoded} != {ref}")
+
+    return failures
+
+
+def check_subarray_max_sums(rng: random.Random, count: int) -> list[str]:
+    """
+    Compare the batch function subarray_max_sums against subarray_max_sum and
+    the reference implementation on random arrays, including values whose
+    sums overflow 64 bit integers.
+
+    :param rng: The random number generator
+    :param count: The number of batches to check
+
+    :return: Descriptions of all batches the implementations disagree on
+    """
+
+    failures = []
+    for _ in range(count):
+        bound = rng.choice((10, 1 << 20, 1 << 62, 1 << 70))
+        arrays = [[rng.randint(-bound, bound) for _ in range(rng.randint(1, 12))] for _ in range(rng.randint(1, 5))]
+        # Also include the exact int64 boundaries
+        if rng.random() < 0.1:
+            arrays.append([1 << 62] * rng.randint(2, 4))
+
+        try:
+            fast = bitburner.subarray_max_sums(arrays)
+        except OverflowError as e:
+            failures.append(f"subarray_max_sums({arrays}): {e!r}")
+            continue
+        single = [bitburner.subarray_max_sum(a) for a in arrays]
+        ref = [reference.subarray_max_sum(a) for a in arrays]
+        if not fast == single == ref:
+            failures.append(f"subarray_max_sums({arrays}): {fast} != {single} != {ref}")
+
+    return failures
+
+
+# Differential checks of bitburner.py against reference.py by name
+checks = {
+    "stock": check_stock,
+    "lz_compression": check_lz_compression,
+    "hamming": check_hamming,
+    "subarray_max_sums": check_subarray_max_sums
+}
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Compare the coding contract solvers against their reference implementations "
+                                        "on seeded random inputs.")
+    parser.add_argument("names", nargs="*", help="Checks to run, default is all")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generating inputs")
+    parser.add_argument("--count", type=int, default=1000, help="Number of random inputs per check")
+    args = parser.parse_args()
+
+    names = args.names or list(checks)
+    if unknown := [n for n in names if n not in checks]:
+        parser.error(f"Unknown checks {unknown}, available are {list(checks)}")
+
+    failed = False
+    for name in names:
+        failures = checks[name](random.Random(f"{args.seed}-{name}"), args.count)
+        print(f"{name}: {len(failures)} failures")
+        for failure in failures[:10]:
+            print(f"    {failure}")
+        failed |= bool(failures)
+
+    return int(failed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,38 +1,165 @@
 #include <Python.h>
-#include <math.h>
-#include <string.h>
-#include <stdlib.h>
-
-static char *sieve(unsigned int max_num) {
-    char *primes = malloc(max_num + 1);
-    memset(primes, 1, max_num + 1);
-    unsigned int end = (unsigned int)(sqrt(max_num)) + 1;
-    for (unsigned int i = 2; i < end; ++i) {
-        if (primes[i]) {
-            for (unsigned int j = i*i; j < max_num + 1; j += i) {
-                primes[j] = 0;
+#include <stdint.h>
+
+/* Factors below this bound are found by trial division */
+#define TRIAL_BOUND 1024
+
+/* (a + b) % m for a, b < m without overflowing 64 bits */
+static uint64_t addmod(uint64_t a, uint64_t b, uint64_t m) {
+    return a >= m - b ? a - (m - b) : a + b;
+}
+
+static uint64_t mulmod(uint64_t a, uint64_t b, uint64_t m) {
+#ifdef __SIZEOF_INT128__
+    return (uint64_t)((unsigned __int128)a * b % m);
+#else
+    uint64_t res = 0;
+    a %= m;
+    while (b) {
+        if (b & 1)
+            res = addmod(res, a, m);
+        a = addmod(a, a, m);
+        b >>= 1;
+    }
+    return res;
+#endif
+}
+
+static uint64_t powmod(uint64_t base, uint64_t exp, uint64_t m) {
+    uint64_t res = 1;
+    base %= m;
+    while (exp) {
+        if (exp & 1)
+            res = mulmod(res, base, m);
+        base = mulmod(base, base, m);
+        exp >>= 1;
+    }
+    return res;
+}
+
+static uint64_t gcd(uint64_t a, uint64_t b) {
+    while (b) {
+        uint64_t t = a % b;
+        a = b;
+        b = t;
+    }
+    return a;
+}
+
+/* Deterministic Miller-Rabin test, these bases suffice for all 64 bit numbers */
+static int is_prime(uint64_t n) {
+    static const uint64_t bases[] = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37};
+
+    if (n < 2)
+        return 0;
+    for (size_t i = 0; i < sizeof(bases) / sizeof(*bases); ++i) {
+        if (n % bases[i] == 0)
+            return n == bases[i];
+    }
+
+    uint64_t d = n - 1;
+    int s = 0;
+    while (!(d & 1)) {
+        d >>= 1;
+        ++s;
+    }
+
+    for (size_t i = 0; i < sizeof(bases) / sizeof(*bases); ++i) {
+        uint64_t x = powmod(bases[i], d, n);
+        if (x == 1 || x == n - 1)
+            continue;
+        int r = 1;
+        for (; r < s; ++r) {
+            x = mulmod(x, x, n);
+            if (x == n - 1)
+                break;
+        }
+        if (r == s)
+            return 0;
+    }
+    return 1;
+}
+
+/* Find a non-trivial factor of the odd composite n using Pollard's rho with Brent's cycle detection */
+static uint64_t pollard_rho(uint64_t n) {
+    for (uint64_t c = 1;; ++c) {
+        uint64_t x = 2, y = 2, ys = 2, q = 1, d = 1;
+        uint64_t r = 1;
+
+        while (d == 1) {
+            x = y;
+            for (uint64_t i = 0; i < r; ++i)
+                y = addmod(mulmod(y, y, n), c % n, n);
+
+            /* Multiply differences to compute the gcd only every 128 steps */
+            for (uint64_t k = 0; k < r && d == 1; k += 128) {
+                ys = y;
+                for (uint64_t i = 0; i < 128 && i < r - k; ++i) {
+                    y = addmod(mulmod(y, y, n), c % n, n);
+                    q = mulmod(q, x > y ? x - y : y - x, n);
+                }
+                d = gcd(q, n);
             }
+            r <<= 1;
+        }
+
+        /* The batch overshot, repeat its steps one by one */
+        if (d == n) {
+            do {
+                ys = addmod(mulmod(ys, ys, n), c % n, n);
+                d = gcd(x > ys ? x - ys : ys - x, n);
+            } while (d == 1);
         }
+
+        if (d != n)
+            return d;
     }
-    return primes;
 }
 
-static PyObject *clib_largest_prime_factor(PyObject *self, PyObject *args) {
-    unsigned int max_num;
+/* Largest prime factor of n, which has no factors below TRIAL_BOUND */
+static uint64_t largest_large_factor(uint64_t n) {
+    if (n == 1 || is_prime(n))
+        return n;
 
-    if (!PyArg_ParseTuple(args, "I:largest_prime", &max_num))
-        return NULL;
+    uint64_t d = pollard_rho(n);
+    uint64_t a = largest_large_factor(d);
+    uint64_t b = largest_large_factor(n / d);
+    return a > b ? a : b;
+}
 
-    char *primes = sieve(max_num);
-    unsigned int i = max_num;
-    for (; i > 0; i--) {
-        if (primes[i] && max_num % i == 0) {
-            break;
+static uint64_t largest_prime_factor(uint64_t n) {
+    uint64_t largest = n;
+
+    if (n < 2)
+        return n;
+
+    for (uint64_t p = 2; p < TRIAL_BOUND && p * p <= n; p += 1 + (p > 2)) {
+        while (n % p == 0) {
+            largest = p;
+            n /= p;
         }
     }
-    free(primes);
 
-    return Py_BuildValue("I", i);
+    /* All remaining factors are larger than the ones found so far */
+    if (n == 1)
+        return largest;
+    if (n < TRIAL_BOUND * TRIAL_BOUND)
+        return n;
+    return largest_large_factor(n);
+}
+
+static PyObject *clib_largest_prime_factor(PyObject *self, PyObject *args) {
+    PyObject *num_obj;
+
+    if (!PyArg_ParseTuple(args, "O!:largest_prime_factor", &PyLong_Type, &num_obj))
+        return NULL;
+
+    /* Raises OverflowError for numbers that do not fit in 64 bits */
+    unsigned long long num = PyLong_AsUnsignedLongLong(num_obj);
+    if (num == (unsigned long long)-1 && PyErr_Occurred())
+        return NULL;
+
+    return PyLong_FromUnsignedLongLong(largest_prime_factor(num));
 }
 
 static PyMethodDef clib_methods[] = {
@@ -42,7 +169,8 @@ static PyMethodDef clib_methods[] = {
         .ml_flags = METH_VARARGS,
         .ml_doc = "Find the largest prime factor of a number.\n\n"
                   ":param num: The number to find the largest prime factor of\n\n"
-                  ":return: num's largest prime factor"
+                  ":return: num's largest prime factor\n\n"
+                  ":raises OverflowError: If num is negative or does not fit in 64 bits"
     },
     {
         .ml_name = NULL,
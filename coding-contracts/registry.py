@@ -0,0 +1,183 @@
+from __future__ import annotations as _annotations
+from collections.abc import Callable as _Callable
+from typing import Any as _Any
+from hashlib import sha256 as _sha256
+import copy as _copy
+import operator as _operator
+
+import bitburner as _bitburner
+import clib as _clib
+import reference as _reference
+
+
+class Solver:
+    """
+    Solver for one coding contract type, consisting of a fast and a
+    reference implementation. Contract data is converted to the
+    implementations' arguments by normalize and their results to the
+    contract answer by answer.
+    """
+
+    def __init__(self, fast: _Callable, reference: _Callable | None = None,
+                 normalize: _Callable[[_Any], tuple] | None = None,
+                 answer: _Callable[[_Any], _Any] | None = None,
+                 equal: _Callable[[_Any, _Any], bool] | None = None):
+        """
+        :param fast: The implementation used by default
+        :param reference: The implementation to verify fast against, defaults
+        to fast
+        :param normalize: Function converting contract data to a tuple of
+        arguments for the implementations, defaults to passing the data as
+        the only argument
+        :param answer: Function converting the implementations' results to
+        the contract answer, defaults to the result itself
+        :param equal: Function checking if two answers are equally valid,
+        defaults to ==
+        """
+
+        self.fast = fast
+        self.reference = reference or fast
+        self.normalize = normalize or (lambda data: (data,))
+        self.answer = answer or (lambda result: result)
+        self.equal = equal or _operator.eq
+
+    def solve(self, data: _Any, reference: bool = False) -> _Any:
+        """
+        Solve a contract.
+
+        :param data: The contract's data
+        :param reference: If the reference implementation should be used
+
+        :return: The contract's answer
+        """
+
+        return self.answer((self.reference if reference else self.fast)(*self.normalize(data)))
+
+
+# All registered solvers by contract type
+solvers: dict[str, Solver] = {}
+
+
+def register(c_type: str, fast: _Callable, reference: _Callable | None = None, **kwargs) -> None:
+    """
+    Register a solver for a coding contract type.
+
+    :param c_type: The coding contract type
+    :param fast: The implementation used by default
+    :param reference: The implementation to verify fast against
+    :param kwargs: Further arguments for Solver
+    """
+
+    solvers[c_type] = Solver(fast, reference, **kwargs)
+
+
+def solve(c_type: str, data: _Any, reference: bool = False) -> _Any:
+    """
+    Solve a contract. This function only takes picklable arguments, so it
+    can be run in other processes.
+
+    :param c_type: The coding contract type
+    :param data: The contract's data
+    :param reference: If the reference implementation should be used
+
+    :return: The contract's answer
+    """
+
+    return solvers[c_type].solve(data, reference)
+
+
+def verify(c_type: str, data: _Any, answer: _Any) -> tuple[_Any, bool]:
+    """
+    Solve a contract with the reference implementation and compare its
+    answer with the fast implementation's.
+
+    :param c_type: The coding contract type
+    :param data: The contract's data
+    :param answer: The fast implementation's answer
+
+    :return: The reference answer and if both answers agree
+    """
+
+    solver = solvers[c_type]
+    # Some reference implementations modify their arguments
+    ref = solver.solve(_copy.deepcopy(data), reference=True)
+
+    return ref, solver.equal(answer, ref)
+
+
+def _solvers_version() -> str:
+    """
+    Hash the files implementing the solvers, so the version changes
+    whenever a solver does.
+
+    :return: The hash as hex string
+    """
+
+    digest = _sha256()
+    for path in (__file__, _bitburner.__file__, _clib.__file__, _reference.__file__):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()
+
+
+def _same_elements(a: list, b: list) -> bool:
+    """
+    Check if two lists contain the same elements in any order.
+    """
+
+    return sorted(a) == sorted(b)
+
+
+def _same_lz_compression(a: str, b: str) -> bool:
+    """
+    Check if two LZ compressions are equally short and decompress to the
+    same text.
+    """
+
+    return len(a) == len(b) and _bitburner.lz_decompression(a) == _bitburner.lz_decompression(b)
+
+
+register("Find Largest Prime Factor", _bitburner.find_largest_prime_factor, _reference.find_largest_prime_factor)
+register("Subarray with Maximum Sum", _bitburner.subarray_max_sum, _reference.subarray_max_sum)
+register("Total Ways to Sum", _bitburner.total_ways_sum, _reference.total_ways_sum)
+register("Total Ways to Sum II", _bitburner.total_ways_sum, _reference.total_ways_sum, normalize=tuple)
+register("Spiralize Matrix", _bitburner.spiralize_matrix, _reference.spiralize_matrix)
+register("Array Jumping Game", _bitburner.array_jump_num, _reference.array_jump_num,
+         answer=lambda jumps: int(jumps != -1))
+register("Array Jumping Game II", _bitburner.array_jump_num, _reference.array_jump_num,
+         answer=lambda jumps: max(0, jumps))
+register("Merge Overlapping Intervals", _bitburner.merge_overlapping_intervals, _reference.merge_overlapping_intervals)
+register("Generate IP Addresses", _bitburner.generate_ips, _reference.generate_ips,
+         answer=lambda ips: str(ips).replace("'", ""))
+register("Algorithmic Stock Trader I", _bitburner.algorithmic_stock, _reference.algorithmic_stock,
+         normalize=lambda data: (data, 1))
+register("Algorithmic Stock Trader II", _bitburner.algorithmic_stock, _reference.algorithmic_stock,
+         normalize=lambda data: (data, len(data) // 2))
+register("Algorithmic Stock Trader III", _bitburner.algorithmic_stock, _reference.algorithmic_stock,
+         normalize=lambda data: (data, 2))
+register("Algorithmic Stock Trader IV", _bitburner.algorithmic_stock, _reference.algorithmic_stock,
+         normalize=lambda data: (data[1], data[0]))
+register("Minimum Path Sum in a Triangle", _bitburner.min_path_sum_triangle, _reference.min_path_sum_triangle)
+register("Unique Paths in a Grid I", _bitburner.unique_paths_grid_I, _reference.unique_paths_grid_I, normalize=tuple)
+register("Unique Paths in a Grid II", _bitburner.unique_paths_grid_II, _reference.unique_paths_grid_II)
+register("Shortest Path in a Grid", _bitburner.shortest_path_grid, _reference.shortest_path_grid,
+         equal=lambda a, b: len(a) == len(b))
+register("Sanitize Parentheses in Expression", _bitburner.sanitize_parentheses, _reference.sanitize_parentheses,
+         equal=_same_elements)
+register("Find All Valid Math Expressions", _bitburner.find_val_exp, _reference.find_val_exp, normalize=tuple,
+         equal=_same_elements)
+register("HammingCodes: Integer to Encoded Binary", _bitburner.hamming_i2b, _reference.hamming_i2b)
+register("HammingCodes: Encoded Binary to Integer", _bitburner.hamming_b2i, _reference.hamming_b2i)
+register("Proper 2-Coloring of a Graph", _bitburner.two_color, _reference.two_color, normalize=tuple)
+register("Compression I: RLE Compression", _bitburner.rle_compression, _reference.rle_compression)
+register("Compression II: LZ Decompression", _bitburner.lz_decompression, _reference.lz_decompression)
+# The reference implementation's default for part_comp is modified for empty strings
+register("Compression III: LZ Compression", _bitburner.lz_compression, lambda plain: _reference.lz_compression(plain, [0]),
+         equal=_same_lz_compression)
+register("Encryption I: Caesar Cipher", _bitburner.encrypt_caesar, _reference.encrypt_caesar, normalize=tuple)
+register("Encryption II: Vigenère Cipher", _bitburner.encrypt_vigenere, _reference.encrypt_vigenere, normalize=tuple)
+
+
+# Version of the registered solvers, changes with any of their implementations
+version = _solvers_version()
@@ -0,0 +1,23 @@
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+
+
+def kill_workers(executor: _ProcessPoolExecutor, wait: bool = False) -> None:
+    """
+    Kill a process pool's processes, aborting the tasks they are running,
+    and shut the pool down.
+
+    :param executor: The process pool to kill
+    :param wait: If the shutdown should wait for the pool's management
+    thread to exit
+    """
+
+    if hasattr(executor, "kill_workers"):
+        # Public since Python 3.14
+        executor.kill_workers()
+    else:
+        # Older versions only expose the processes through the private
+        # _processes dict, mapping pids to processes. It exists since Python
+        # 3.2 and is set to None on shutdown.
+        for p in list((executor._processes or {}).values()):
+            p.kill()
+    executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,5 +1,10 @@
 const CONTRACT_PORT = 8;
-const BASE_URL = "http://localhost:8080/solve_contract";
+const BASE_URL = "http://localhost:8080/solve_contracts";
+// Number of retries and delay in ms when the API is too busy to accept contracts
+const BUSY_RETRIES = 5;
+const BUSY_DELAY = 10000;
+// Maximum number of contracts per request, the API rejects larger batches
+const BATCH_SIZE = 50;
 const COLORS = {
 	"red": "\x1b[31m",
 	"yellow": "\x1b[38;5;227m",
@@ -55,32 +60,65 @@ function write_error(ns, contract, error) {
 }
 
 /**
- * Fetch answer for coding contract
+ * Fetch answers for coding contracts in batches of at most BATCH_SIZE
  * 
  * @param {NS} ns
- * @param {any} contract The coding contract to fetch the answer to
+ * @param {any[]} contracts The coding contracts to fetch the answers to
  * 
- * @return {any} The answer to the contract
+ * @return {any[]} The API's results in the same order as contracts, each
+ * containing either an answer or an error
  */
-async function fetch_answer(ns, contract) {
+async function fetch_answers(ns, contracts) {
+	let results = [];
+	for (let i = 0; i < contracts.length; i += BATCH_SIZE) {
+		let batch_results = await fetch_batch(ns, contracts.slice(i, i + BATCH_SIZE));
+		if (!batch_results)
+			return null;
+		results.push(...batch_results);
+	}
+	return results;
+}
+
+/**
+ * Fetch answers for multiple coding contracts with a single request, retrying
+ * while the API is too busy
+ * 
+ * @param {NS} ns
+ * @param {any[]} contracts The coding contracts to fetch the answers to
+ * 
+ * @return {any[]} The API's results in the same order as contracts, each
+ * containing either an answer or an error
+ */
+async function fetch_batch(ns, contracts) {
 	let res;
-	try {
-		res = await fetch(`${BASE_URL}?c_type=${contract.type}&data=${JSON.stringify(contract.data)}`);
-	} catch (err) {
-		return null;
+	for (let retries = 0; ; retries++) {
+		try {
+			res = await fetch(BASE_URL, {
+				method: "POST",
+				headers: {"Content-Type": "application/json"},
+				body: JSON.stringify(contracts.map(c => ({c_type: c.type, data: c.data})))
+			});
+		} catch (err) {
+			return null;
+		}
+
+		if (res.status !== 503 || retries >= BUSY_RETRIES)
+			break;
+
+		ns.print(COLORS.yellow + "API busy, retrying" + COLORS.default);
+		await ns.sleep(BUSY_DELAY);
 	}
 
 	if (!res.ok) {
-		throw {type: contract.type, data: contract.data, error_code: res.status, error: await res.text()};
+		let error = {error_code: res.status, error: await res.text()};
+		return contracts.map(() => error);
 	}
 
 	try {
-		res = await res.json();
+		return await res.json();
 	} catch(err) {
-		throw {type: contract.type, data: contract.data, error: "Answer could not be parsed", answer: await res.text()};
+		return contracts.map(() => ({error: "Answer could not be parsed"}));
 	}
-
-	return res;
 }
 
 /**
@@ -108,36 +146,43 @@ export async function main(ns) {
 	disable_logs(ns);
 
 	while (true) {
+		let contracts = [];
 		let contract;
 		while ((contract = ns.readPort(CONTRACT_PORT)) !== "NULL PORT DATA") {
 			contract = JSON.parse(contract);
-			if (!set_contract_info(ns, contract))
-				continue;
+			if (set_contract_info(ns, contract))
+				contracts.push(contract);
+		}
+
+		if (contracts.length) {
+			let results;
+			if (!(results = await fetch_answers(ns, contracts))) {
+				ns.print(COLORS.yellow + "Could not contact API" + COLORS.default);
+				contracts = [];
+			}
+
+			for (let i = 0; i < contracts.length; i++) {
+				contract = contracts[i];
 
-			let answer;
-			try {
-				if (!(answer = await fetch_answer(ns, contract))) {
-					ns.print(COLORS.yellow + "Could not contact API" + COLORS.default);
+				if (!("answer" in results[i])) {
+					write_error(ns, contract, {type: contract.type, data: contract.data, ...results[i]});
+					ns.print(COLORS.red + "Contract error for contract " + contract.filename + " on " + contract.hostname + COLORS.default);
 					continue;
 				}
-			}
-			catch (err) {
-				write_error(ns, contract, err);
-				ns.print(COLORS.red + "Contract error for contract " + contract.filename + " on " + contract.hostname + COLORS.default);
-				continue;
-			}
 
-			if (ns.codingcontract.attempt(answer, contract.filename, contract.hostname)) {
-				let err_file = get_err_file(contract);
-				if (ns.fileExists(err_file, contract.hostname))
-					ns.rm(err_file, contract.hostname);
-				
-				ns.print("Solved contract " + contract.filename + " on " + contract.hostname);
-			}
-			else {
-				write_error(ns, contract, {type: contract.type, data: contract.data,
-										   error: "Wrong answer", answer: answer});
-				ns.print(COLORS.red + "Failed contract " + contract.filename + " on " + contract.hostname + COLORS.red);
+				let answer = results[i].answer;
+				if (ns.codingcontract.attempt(answer, contract.filename, contract.hostname)) {
+					let err_file = get_err_file(contract);
+					if (ns.fileExists(err_file, contract.hostname))
+						ns.rm(err_file, contract.hostname);
+					
+					ns.print("Solved contract " + contract.filename + " on " + contract.hostname);
+				}
+				else {
+					write_error(ns, contract, {type: contract.type, data: contract.data,
+											   error: "Wrong answer", answer: answer});
+					ns.print(COLORS.red + "Failed contract " + contract.filename + " on " + contract.hostname + COLORS.red);
+				}
 			}
 		}
 		await ns.sleep(60000);